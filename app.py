@@ -1,25 +1,59 @@
 import asyncio
+import contextlib
+import cProfile
 import logging
-from typing import Dict, Union, Tuple
+import os
+import resource
+import shlex
+import threading
+import time
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 
 import grpc
 import click
 
-from rpc_pb2 import PutRequest, RangeRequest, DeleteRangeRequest
-from rpc_pb2_grpc import KVStub
+# imported first so that it can select the C++ protobuf backend
+from serialization import RawKVStub, backend
+from rpc_pb2 import PutRequest, RangeRequest, RangeResponse, DeleteRangeRequest
+from rpc_pb2_grpc import KVStub, WatchStub
+from utils import to_bytes, to_string, prefix_range_end
+from keyindex import KeyIndex
+from pipeline import Operation, Pipeline, parse_jsonl
+from concurrency import Election, Mutex, Session
+from configview import ConfigView
+from encryption import ValueCodec
+import profiling
+from profiling import LoopLagMonitor, TracedChannel, span
+from export import export_range
+from history import ADDED, CHANGED, REMOVED, diff_revisions
+from importer import READERS, MappedFile, detect_format, import_records
+from maintenance import compact, defragment, hash_kv, member_endpoints, status
+from scheduler import BULK, Scheduler, ScheduledStub
+
+try:
+    import readline
+except ImportError:
+    readline = None
 
 logging.basicConfig(level=logging.INFO,
                     format="%(levelname)s:%(name)s:%(lineno)s:%(message)s")
 # logging.basicConfig(level=logging.INFO, format="%(message)s")
 logger = logging.getLogger(__name__)
 
+ETCD_ENDPOINT = "localhost:2379"
+# upper bound of the traced connection setup
+CONNECT_TIMEOUT = 5.0
+
 
 class Etcd:
 
-    def __init__(self, stub: KVStub) -> None:
+    def __init__(self, stub: KVStub, codec: Optional[ValueCodec] = None) -> None:
         self.stub = stub
+        self.codec = codec
 
     async def put(self, key: bytes, value: bytes):
+        if self.codec is not None:
+            value = self.codec.encode(key, value)
         response = await self.stub.Put(PutRequest(
             key=key,
             value=value
@@ -28,16 +62,24 @@ class Etcd:
         logger.info('ok')
         return response
 
-    async def get(self, key: bytes, range_end: bytes, limit: int = 0):
+    async def get(self, key: bytes, range_end: bytes, limit: int = 0, revision: int = 0):
         response = await self.stub.Range(RangeRequest(
             key=key,
             range_end=range_end,
-            limit=limit
+            limit=limit,
+            revision=revision
         ))
         # logger.info(response)
-        for item in response.kvs:
-            logger.info(to_string(item.key))
-            logger.info(to_string(item.value))
+        with span("format", kvs=len(response.kvs)):
+            for item in response.kvs:
+                logger.info(to_string(item.key))
+                if self.codec is not None:
+                    try:
+                        item.value = self.codec.decode(item.key, item.value)
+                    except ValueError as e:
+                        logger.error(e)
+                        continue
+                logger.info(to_string(item.value))
         return response
 
     async def delete(self, key: bytes, range_end: bytes):
@@ -49,75 +91,558 @@ class Etcd:
         logger.info(response.deleted)
         return response
 
+    async def keys(self, key: bytes, range_end: bytes, limit: int = 0) -> Tuple[List[bytes], bool]:
+        response = await self.range(key, range_end, limit=limit, keys_only=True)
+        return [item.key for item in response.kvs], response.more
 
-def to_bytes(key: Union[str, bytes]):
-    if key is None:
-        return key
-    if isinstance(key, bytes):
-        return key
-    return bytes(key, encoding="utf8")
+    async def range(self, key: bytes, range_end: bytes, **options) -> RangeResponse:
+        return await self.stub.Range(RangeRequest(
+            key=key,
+            range_end=range_end,
+            **options
+        ))
 
+    async def scan(self, key: bytes, range_end: bytes, page_size: int = 1000,
+                   **options) -> AsyncIterator[RangeResponse]:
+        """
+        Yields the range page by page. Without a revision, pages after the
+        first are pinned to the revision of the first response, so together
+        they form one snapshot.
+        """
+        while True:
+            response = await self.range(key, range_end, limit=page_size, **options)
+            yield response
+            if not response.more or not response.kvs:
+                break
+            key = response.kvs[-1].key + b"\0"
+            # header.revision is the current revision, not the one read at
+            options["revision"] = options.get("revision") or response.header.revision
+
+
+async def run_command(etcd: Etcd, method, *args: Tuple[bytes], **kwargs: Dict):
+    if method == "get" or method == "del":
+        if len(args) > 1:
+            key, range_end = to_bytes(args[0]), args[1]
+        else:
+            key, range_end = to_bytes(args[0]), None
+        prefix = kwargs.get("prefix")
+        if prefix:
+            range_end = prefix_range_end(key)
+        key, range_end = to_bytes(key), to_bytes(range_end)
+
+        if method == "get":
+            await etcd.get(key=key, range_end=range_end, limit=kwargs.get("limit", 0),
+                           revision=kwargs.get("rev", 0))
+        elif method == 'del':
+            await etcd.delete(key=key, range_end=range_end)
+
+    elif method == "put":
+        key, value = to_bytes(args[0]), to_bytes(args[1])
+        await etcd.put(key, value)
+
+    elif method == "ls":
+        path, separator = to_bytes(args[0] if args else ""), to_bytes(kwargs.get("separator", "/"))
+        if path and not path.endswith(separator):
+            path += separator
+        index = kwargs.get("index") or KeyIndex(etcd, prefix=path)
+        await index.refresh()
+        for name, count in index.ls(path, separator):
+            if name.endswith(separator):
+                logger.info("%s (%d)", to_string(name), count)
+            else:
+                logger.info(to_string(name))
 
-def to_string(key: Union[str, bytes]):
-    if key is None:
-        return key
-    if isinstance(key, str):
-        return key
-    return str(key, encoding="utf8")
+    else:
+        logger.error("Unknown command")
 
 
-def prefix_range_end(prefix):
+async def wait_connected(channel) -> None:
     """
-    https://github.com/kragniz/python-etcd3/blob/master/etcd3/utils.py
+    Waits until the channel is ready or its first connection attempt fails;
+    a failed attempt is left for the first RPC to report, as without tracing.
     """
-    s = bytearray(prefix)
-    for i in reversed(range(len(s))):
-        if s[i] < 0xff:
-            s[i] = s[i] + 1
-            break
-    return bytes(s)
+    state = channel.get_state(try_to_connect=True)
+    while state not in (grpc.ChannelConnectivity.READY, grpc.ChannelConnectivity.TRANSIENT_FAILURE,
+                        grpc.ChannelConnectivity.SHUTDOWN):
+        await channel.wait_for_state_change(state)
+        state = channel.get_state()
+
+
+@contextlib.asynccontextmanager
+async def open_channel():
+    """
+    Opens the channel to ETCD_ENDPOINT. While tracing, connection setup gets
+    its own span, RPCs are traced and the event loop lag is monitored.
+    """
+    async with grpc.aio.insecure_channel(ETCD_ENDPOINT) as channel:
+        if profiling.tracer is None:
+            yield channel
+            return
+        monitor = LoopLagMonitor()
+        monitor.start()
+        try:
+            with span("connect", target=ETCD_ENDPOINT):
+                try:
+                    await asyncio.wait_for(wait_connected(channel), CONNECT_TIMEOUT)
+                except asyncio.TimeoutError:
+                    pass
+            yield TracedChannel(channel)
+        finally:
+            monitor.stop()
+            logger.info("max event loop lag %.1fms", monitor.max_lag * 1000)
+
+
+def current_codec() -> Optional[ValueCodec]:
+    """Returns the value codec of the --keyring option of the running command."""
+    ctx = click.get_current_context(silent=True)
+    if ctx is None or ctx.find_root().obj is None:
+        return None
+    return ctx.find_root().obj.get("codec")
 
 
 async def etcd_command(method, *args: Tuple[bytes], **kwargs: Dict):
-    async with grpc.aio.insecure_channel("localhost:2379") as channel:
+    async with open_channel() as channel:
         stub = KVStub(channel=channel)
-        etcd = Etcd(stub=stub)
+        etcd = Etcd(stub=stub, codec=current_codec())
+        await run_command(etcd, method, *args, **kwargs)
 
-        if method == "get" or method == "del":
-            if len(args) > 1:
-                key, range_end = to_bytes(args[0]), args[1]
-            else:
-                key, range_end = to_bytes(args[0]), None
-            prefix = kwargs.get("prefix")
-            if prefix:
-                range_end = prefix_range_end(key)
-            key, range_end = to_bytes(key), to_bytes(range_end)
 
-            if method == "get":
-                await etcd.get(key=key, range_end=range_end, limit=kwargs.get("limit", 0))
-            elif method == 'del':
-                await etcd.delete(key=key, range_end=range_end)
+def parse_command(line: str) -> Tuple[str, Dict]:
+    """
+    Parses one command line with the option definitions of the CLI command
+    of the same name.
+    """
+    argv = shlex.split(line)
+    name, argv = argv[0], argv[1:]
+    command = cli.commands.get(name)
+    if name not in SHELL_COMMANDS or command is None:
+        raise click.UsageError("Unknown command: %s" % name)
+    ctx = command.make_context(name, argv)
+    if name in ("get", "del") and not ctx.params["key"]:
+        raise click.UsageError("Missing argument 'key'", ctx)
+    return name, ctx.params
+
+
+def parse_operation(line: str) -> Operation:
+    if line.startswith("{"):
+        return parse_jsonl(line)
+    name, params = parse_command(line)
+    if name == "put":
+        return Operation.from_dict({"op": "put", "key": params["key"], "value": params["value"]})
+    if name not in ("get", "del") or not params["key"]:
+        raise click.UsageError("%s is not supported in scripts" % name)
+    key = params["key"]
+    return Operation.from_dict({
+        "op": name,
+        "key": key[0],
+        "range_end": key[1] if len(key) > 1 else None,
+        "prefix": params["prefix"],
+        "limit": params.get("limit", 0),
+    })
+
+
+async def exec_command(path: str, concurrency: int, rate: float = 0):
+    if backend() == "python":
+        logger.warning("protobuf is using the pure-Python backend, message decoding will be slow")
+    operations = []
+    with open(path, encoding="utf8") as f:
+        for lineno, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            try:
+                operations.append(parse_operation(line))
+            except (click.ClickException, click.exceptions.Exit, ValueError, KeyError) as e:
+                raise click.ClickException("%s:%d: %s" % (path, lineno, e))
+
+    async with open_channel() as channel:
+        stub, raw_stub = KVStub(channel=channel), None
+        if rate:
+            scheduler = Scheduler(prefix_rates={b"": (rate, None)}, max_concurrency=concurrency)
+            stub = ScheduledStub(stub, scheduler, priority=BULK)
+        else:
+            raw_stub = RawKVStub(channel=channel)
+        pipeline = Pipeline(stub, operations, concurrency=concurrency, raw_stub=raw_stub,
+                            codec=current_codec())
+        with span("pipeline", ops=len(operations)):
+            await pipeline.run()
+
+    failed = 0
+    with span("format"):
+        for i, op in enumerate(operations):
+            name = "%d %s %s" % (i + 1, op.method, to_string(op.key))
+            if op.coalesced_into is not None:
+                logger.info("%s coalesced into %d", name, op.coalesced_into + 1)
+            elif op.error is not None:
+                failed += 1
+                logger.error("%s failed: %s", name, op.error)
+            elif op.method == "get":
+                logger.info("%s %d kvs %.1fms", name, len(op.result.kvs), op.elapsed * 1000)
+                for item in op.result.kvs:
+                    logger.info(to_string(item.key))
+                    logger.info(to_string(item.value))
+            elif op.method == "del":
+                logger.info("%s deleted %d %.1fms", name, op.result.deleted, op.elapsed * 1000)
+            else:
+                logger.info("%s ok %.1fms", name, op.elapsed * 1000)
+    logger.info("%d ops (%d failed) in %.3fs, %.0f ops/s", len(operations), failed,
+                pipeline.elapsed, len(operations) / pipeline.elapsed if pipeline.elapsed else 0)
+
+
+async def export_command(key: str, prefix: bool, out_dir: str, workers: int,
+                         page_size: int, match: Optional[str]):
+    key = to_bytes(key)
+    range_end = prefix_range_end(key) if prefix else b""
+    if not key:
+        key, range_end = b"\0", b"\0"
+    async with open_channel() as channel:
+        start = time.perf_counter()
+        try:
+            written = await export_range(channel, key, range_end, out_dir, workers=workers or None,
+                                         page_size=page_size, match=match)
+        except FileExistsError as e:
+            raise click.ClickException("%s, shards of an earlier export would be mixed in" % e)
+    elapsed = time.perf_counter() - start
+    logger.info("%d records in %.3fs, %.0f records/s", written, elapsed,
+                written / elapsed if elapsed else 0)
+
+
+async def import_command(path: str, format_: Optional[str], concurrency: int):
+    try:
+        reader = READERS[format_ or detect_format(path)]
+    except ValueError as e:
+        raise click.UsageError(str(e))
+    async with open_channel() as channel:
+        start = time.perf_counter()
+        with MappedFile(path) as mapped:
+            result = await import_records(channel, reader(mapped), concurrency=concurrency,
+                                          codec=current_codec())
+        elapsed = time.perf_counter() - start
+    if result.error is not None:
+        logger.error("%d puts failed, first error: %s", result.failed, result.error)
+    if result.read_error is not None:
+        raise click.ClickException("%s\nstopped after importing %d records"
+                                   % (result.read_error, result.written))
+    # ru_maxrss is in kilobytes on Linux
+    logger.info("%d records in %.3fs, %.0f records/s, max rss %.1fMB", result.written, elapsed,
+                result.written / elapsed if elapsed else 0,
+                resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024)
+
+
+async def lock_command(name: str, command: Tuple[str], ttl: int):
+    async with open_channel() as channel:
+        async with Session(channel, ttl=ttl) as session:
+            async with Mutex(session, to_bytes(name)) as mutex:
+                logger.info(to_string(mutex.key))
+                lost = asyncio.ensure_future(session.lost.wait())
+                if not command:
+                    # hold the lock until interrupted or lost
+                    await lost
+                    logger.error("lock %s lost", name)
+                    return 1
+                process = await asyncio.create_subprocess_exec(*command)
+                finished = asyncio.ensure_future(process.wait())
+                await asyncio.wait([finished, lost], return_when=asyncio.FIRST_COMPLETED)
+                if finished.done():
+                    lost.cancel()
+                    return finished.result()
+                logger.error("lock %s lost, killing %s", name, command[0])
+                process.kill()
+                await finished
+                return 1
+
+
+async def elect_command(name: str, proposal: Optional[str], ttl: int):
+    async with open_channel() as channel:
+        async with Session(channel, ttl=ttl) as session:
+            election = Election(session, to_bytes(name))
+            if proposal is None:
+                leader = await election.leader()
+                if leader is not None:
+                    logger.info(to_string(leader.key))
+                    logger.info(to_string(leader.value))
+                return
+            await election.campaign(to_bytes(proposal))
+            try:
+                logger.info(to_string(election.key))
+                # stay leader until interrupted or the lease is lost
+                await session.lost.wait()
+                logger.error("leadership of %s lost", name)
+                return 1
+            finally:
+                await election.resign()
+
+
+async def diff_command(prefix: str, from_rev: int, to_rev: int, values: bool):
+    key = to_bytes(prefix)
+    if key:
+        range_end = prefix_range_end(key)
+    else:
+        key = range_end = b"\0"
+    codec = current_codec()
+    counts = {ADDED: 0, REMOVED: 0, CHANGED: 0}
+    marks = {ADDED: "+", REMOVED: "-", CHANGED: "~"}
+    async with open_channel() as channel:
+        etcd = Etcd(stub=KVStub(channel=channel))
+        try:
+            async for kind, item in diff_revisions(etcd, key, range_end, from_rev, to_rev):
+                counts[kind] += 1
+                logger.info("%s %s", marks[kind], to_string(item.key))
+                if values and kind != REMOVED:
+                    try:
+                        value = codec.decode(item.key, item.value) if codec is not None else item.value
+                    except ValueError as e:
+                        logger.error(e)
+                        continue
+                    logger.info(to_string(value))
+        except ValueError as e:
+            raise click.UsageError(str(e))
+    logger.info("%d added, %d removed, %d changed", counts[ADDED], counts[REMOVED], counts[CHANGED])
+
+
+async def config_command(prefix: str, watch: bool):
+    async with open_channel() as channel:
+        etcd = Etcd(stub=KVStub(channel=channel), codec=current_codec())
+        view = ConfigView(etcd, WatchStub(channel), prefix)
+        async with view:
+            snapshot = view.snapshot
+            while True:
+                logger.info("revision %d, %d keys", snapshot.revision, len(snapshot))
+                for key, value in snapshot.items():
+                    logger.info("%s = %s", to_string(key), to_string(value))
+                if not watch:
+                    break
+                snapshot = await view.updated()
+
+
+async def compact_command(keep: int, physical: bool):
+    async with open_channel() as channel:
+        revision, current = await compact(channel, keep, physical=physical)
+    if revision:
+        logger.info("compacted revision %d (current %d)", revision, current)
+    else:
+        logger.info("nothing to compact (current revision %d)", current)
+
+
+async def status_command(hash_: bool):
+    async with open_channel() as channel:
+        endpoints = await member_endpoints(channel)
+    revision = 0
+    for name, endpoint in endpoints:
+        response = await status(endpoint)
+        logger.info("%s %s version=%s db_size=%d db_size_in_use=%d leader=%x raft_term=%d "
+                    "raft_index=%d revision=%d", name, endpoint, response.version, response.dbSize,
+                    response.dbSizeInUse, response.leader, response.raftTerm, response.raftIndex,
+                    response.header.revision)
+        for error in response.errors:
+            logger.error("%s %s", name, error)
+        if hash_:
+            # hash every member at the same revision so the results are comparable
+            revision = revision or response.header.revision
+            hashed = await hash_kv(endpoint, revision)
+            logger.info("%s hash=%d revision=%d compact_revision=%d", name, hashed.hash,
+                        revision, hashed.compact_revision)
+
+
+async def defrag_command():
+    async with open_channel() as channel:
+        endpoints = await member_endpoints(channel)
+    async for name, before, after in defragment(endpoints):
+        logger.info("%s db_size %d -> %d (%d freed)", name, before, after, before - after)
+
+
+class KeyCache:
+    """
+    Caches keys_only prefix scans for shell completion. A prefix that was
+    fetched completely also answers every longer prefix without an RPC.
+    """
 
-        elif method == "put":
-            key, value = to_bytes(args[0]), to_bytes(args[1])
-            await etcd.put(key, value)
+    def __init__(self, etcd: Etcd, ttl: float = 5.0, limit: int = 1000) -> None:
+        self.etcd = etcd
+        self.ttl = ttl
+        self.limit = limit
+        self.entries: Dict[bytes, Tuple[float, List[bytes]]] = {}
+
+    def lookup(self, prefix: bytes) -> Optional[List[bytes]]:
+        now = time.monotonic()
+        for cached, (fetched_at, keys) in self.entries.items():
+            if now - fetched_at > self.ttl or not prefix.startswith(cached):
+                continue
+            return [key for key in keys if key.startswith(prefix)]
+        return None
+
+    async def complete(self, prefix: bytes) -> List[bytes]:
+        keys = self.lookup(prefix)
+        if keys is not None:
+            return keys
+        range_end = prefix_range_end(prefix) if prefix else b"\0"
+        keys, more = await self.etcd.keys(prefix or b"\0", range_end, limit=self.limit)
+        if not more:
+            self.entries[prefix] = (time.monotonic(), keys)
+        return keys
+
+    def invalidate(self) -> None:
+        self.entries.clear()
+
+
+class Shell:
+    """
+    Interactive session that keeps one event loop, channel and KVStub, so
+    every command costs a single RPC round-trip. The loop runs in a thread
+    of its own and input() on the main thread, where Ctrl-C clears the line
+    or cancels the running command.
+    """
 
+    prompt = "etcd> "
+    history_file = os.path.expanduser("~/.etcd3_cli_history")
+
+    def __init__(self, etcd: Etcd, loop: asyncio.AbstractEventLoop) -> None:
+        self.etcd = etcd
+        self.loop = loop
+        self.cache = KeyCache(etcd)
+        self.matches: List[str] = []
+        self.index = KeyIndex(etcd)
+
+    def completer(self, text: str, state: int):
+        # readline calls this from the input thread while the loop is idle
+        # waiting on it, so the scan can be scheduled back onto the loop.
+        if state == 0:
+            line = readline.get_line_buffer()
+            if not line[:readline.get_begidx()].strip():
+                self.matches = [name for name in SHELL_COMMANDS + ("exit",)
+                                if name.startswith(text)]
+            else:
+                future = asyncio.run_coroutine_threadsafe(
+                    self.cache.complete(to_bytes(text)), self.loop)
+                try:
+                    self.matches = [to_string(key) for key in future.result(timeout=2)]
+                except Exception:
+                    self.matches = []
+        if state < len(self.matches):
+            return self.matches[state]
+        return None
+
+    def setup_readline(self) -> None:
+        if readline is None:
+            return
+        readline.set_completer(self.completer)
+        readline.set_completer_delims(" \t\n")
+        readline.parse_and_bind("tab: complete")
+        if os.path.exists(self.history_file):
+            readline.read_history_file(self.history_file)
+
+    def save_history(self) -> None:
+        if readline is None:
+            return
+        readline.write_history_file(self.history_file)
+
+    async def execute(self, line: str) -> None:
+        try:
+            name, params = parse_command(line)
+        except click.exceptions.Exit:
+            return
+        except click.ClickException as e:
+            e.show()
+            return
+        if name == "put":
+            await run_command(self.etcd, "put", params["key"], params["value"])
+            self.cache.invalidate()
+        elif name == "del":
+            await run_command(self.etcd, "del", *params["key"], prefix=params["prefix"])
+            self.cache.invalidate()
+        elif name == "ls":
+            await run_command(self.etcd, "ls", *params["path"],
+                              separator=params["separator"], index=self.index)
         else:
-            logger.error("Unknown command")
+            await run_command(self.etcd, "get", *params["key"],
+                              limit=params["limit"], prefix=params["prefix"], rev=params["rev"])
+
+    def run(self) -> None:
+        self.setup_readline()
+        try:
+            while True:
+                try:
+                    line = input(self.prompt)
+                except EOFError:
+                    print()
+                    break
+                except KeyboardInterrupt:
+                    print()
+                    continue
+                line = line.strip()
+                if not line:
+                    continue
+                if line in ("exit", "quit"):
+                    break
+                future = asyncio.run_coroutine_threadsafe(self.execute(line), self.loop)
+                try:
+                    future.result()
+                except KeyboardInterrupt:
+                    future.cancel()
+                    print()
+                except grpc.aio.AioRpcError as e:
+                    logger.error("%s: %s", e.code().name, e.details())
+                except ValueError as e:
+                    logger.error(e)
+                except Exception as e:
+                    # one bad command must not end the session
+                    logger.exception(e)
+        finally:
+            self.save_history()
+
+
+def shell_command():
+    codec = current_codec()
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    stack = contextlib.AsyncExitStack()
+
+    def call(coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, loop).result()
+
+    async def connect() -> Etcd:
+        channel = await stack.enter_async_context(open_channel())
+        return Etcd(stub=KVStub(channel=channel), codec=codec)
+
+    try:
+        Shell(call(connect()), loop).run()
+    finally:
+        call(stack.aclose())
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
 
 
 @click.group()
-def cli():
-    pass
+@click.option("--keyring", envvar="ETCD3_KEYRING", default=None, type=click.Path(exists=True, dir_okay=False),
+              help="Keyring file enabling client-side value encryption for its prefixes")
+@click.option("--profile", default=None, type=click.Path(dir_okay=False),
+              help="Write a Chrome trace (*.json) or a cProfile/pstats file of the command")
+@click.pass_context
+def cli(ctx, keyring, profile):
+    ctx.obj = {"codec": ValueCodec.from_keyring(keyring) if keyring else None}
+    if profile and profile.endswith(".json"):
+        tracer = profiling.start_tracing()
+        ctx.call_on_close(lambda: tracer.dump(profile))
+    elif profile:
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+        def dump():
+            profiler.disable()
+            profiler.dump_stats(profile)
+        ctx.call_on_close(dump)
 
 
 @click.command(help="Gets the key or a range of keys")
 @click.argument("key", metavar="key", nargs=-1, type=str)
 @click.option("--limit", default=0, help="Maximum number of results", type=int)
 @click.option("--prefix", is_flag=True, show_default=True, help="Get keys with matching prefix", type=bool)
-def get(key, limit, prefix):
+@click.option("--rev", default=0, help="Revision to read at, 0 for the latest", type=int)
+def get(key, limit, prefix, rev):
     asyncio.run(etcd_command("get", *key, **
-                {"limit": limit, "prefix": prefix}))
+                {"limit": limit, "prefix": prefix, "rev": rev}))
 
 
 @click.command(help="Puts the given key into the store")
@@ -134,9 +659,121 @@ def delete(key, prefix):
     asyncio.run(etcd_command("del", *key, **{"prefix": prefix}))
 
 
+@click.command(help="Lists the immediate children of a key path with key counts")
+@click.argument("path", metavar="path", nargs=-1, type=str)
+@click.option("--separator", default="/", show_default=True, help="Path separator", type=str)
+def ls(path, separator):
+    asyncio.run(etcd_command("ls", *path, **{"separator": separator}))
+
+
+@click.command(name="exec", help="Runs a script or JSONL file of get/put/del operations concurrently")
+@click.argument("path", metavar="file", type=click.Path(exists=True, dir_okay=False))
+@click.option("--concurrency", default=64, show_default=True, help="Maximum number of RPCs in flight",
+              type=click.IntRange(min=1))
+@click.option("--rate", default=0, help="Maximum RPCs per second, 0 for unlimited",
+              type=click.FloatRange(min=0))
+def execute(path, concurrency, rate):
+    asyncio.run(exec_command(path, concurrency, rate))
+
+
+@click.command(name="export", help="Exports a range to sharded JSONL files using worker processes")
+@click.argument("key", metavar="key", default="", type=str)
+@click.option("--prefix", is_flag=True, help="Export keys with matching prefix", type=bool)
+@click.option("--out-dir", default="export", show_default=True, help="Directory for part-*.jsonl shards",
+              type=click.Path(file_okay=False))
+@click.option("--workers", default=0, help="Number of worker processes, 0 for one per CPU", type=int)
+@click.option("--page-size", default=1000, show_default=True, help="Keys fetched per Range call", type=int)
+@click.option("--match", default=None, help="Only export keys matching this regular expression", type=str)
+def export(key, prefix, out_dir, workers, page_size, match):
+    asyncio.run(export_command(key, prefix, out_dir, workers, page_size, match))
+
+
+@click.command(name="import", help="Imports a JSONL, CSV or length-prefixed protobuf file through a memory map")
+@click.argument("path", metavar="file", type=click.Path(exists=True, dir_okay=False))
+@click.option("--format", "format_", default=None, type=click.Choice(sorted(READERS)),
+              help="File format, detected from the extension by default")
+@click.option("--concurrency", default=64, show_default=True, help="Maximum number of puts in flight",
+              type=click.IntRange(min=1))
+def import_(path, format_, concurrency):
+    asyncio.run(import_command(path, format_, concurrency))
+
+
+@click.command(help="Acquires a named lock and runs a command or holds it until interrupted",
+               context_settings={"ignore_unknown_options": True, "allow_interspersed_args": False})
+@click.argument("name", metavar="name")
+@click.argument("command", metavar="command", nargs=-1, type=str)
+@click.option("--ttl", default=10, show_default=True, help="Lease TTL in seconds", type=int)
+def lock(name, command, ttl):
+    code = asyncio.run(lock_command(name, command, ttl))
+    raise SystemExit(code or 0)
+
+
+@click.command(help="Campaigns for leadership with a proposal, or prints the current leader")
+@click.argument("name", metavar="name")
+@click.argument("proposal", metavar="proposal", required=False)
+@click.option("--ttl", default=10, show_default=True, help="Lease TTL in seconds", type=int)
+def elect(name, proposal, ttl):
+    code = asyncio.run(elect_command(name, proposal, ttl))
+    raise SystemExit(code or 0)
+
+
+@click.command(help="Shows the keys added, removed and changed between two revisions")
+@click.option("--from-rev", required=True, help="Revision to compare from", type=int)
+@click.option("--to-rev", default=0, help="Revision to compare to, 0 for the latest", type=int)
+@click.option("--prefix", default="", help="Only compare keys with this prefix", type=str)
+@click.option("--values", is_flag=True, help="Also print the new values", type=bool)
+def diff(from_rev, to_rev, prefix, values):
+    asyncio.run(diff_command(prefix, from_rev, to_rev, values))
+
+
+@click.command(help="Prints the configuration under a prefix as one snapshot")
+@click.argument("prefix", metavar="prefix", default="", type=str)
+@click.option("--watch", is_flag=True, help="Print the snapshot again after every change", type=bool)
+def config(prefix, watch):
+    asyncio.run(config_command(prefix, watch))
+
+
+@click.command(name="compact", help="Compacts the revision history, keeping the latest revisions")
+@click.option("--keep", default=1000, show_default=True, help="Number of recent revisions to keep",
+              type=click.IntRange(min=0))
+@click.option("--physical", is_flag=True, help="Wait until the compaction is physically applied", type=bool)
+def compact_(keep, physical):
+    asyncio.run(compact_command(keep, physical))
+
+
+@click.command(name="status", help="Prints the status of every cluster member")
+@click.option("--hash", "hash_", is_flag=True, help="Also print each member's KV hash", type=bool)
+def status_(hash_):
+    asyncio.run(status_command(hash_))
+
+
+@click.command(help="Defragments cluster members one at a time")
+def defrag():
+    asyncio.run(defrag_command())
+
+
+@click.command(help="Starts an interactive shell that reuses one connection")
+def shell():
+    shell_command()
+
+
 cli.add_command(get)
 cli.add_command(put)
 cli.add_command(delete)
+cli.add_command(ls)
+cli.add_command(execute)
+cli.add_command(export)
+cli.add_command(import_)
+cli.add_command(lock)
+cli.add_command(elect)
+cli.add_command(diff)
+cli.add_command(config)
+cli.add_command(compact_)
+cli.add_command(status_)
+cli.add_command(defrag)
+cli.add_command(shell)
+
+SHELL_COMMANDS = ("get", "put", "del", "ls")
 
 
 if __name__ == '__main__':
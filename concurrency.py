@@ -0,0 +1,246 @@
+"""
+Locks and leader election following the etcd concurrency recipe.
+
+Every participant owns a lease (Session) and creates <prefix>/<lease id>
+through a Txn that only succeeds if the key does not exist yet. The owner is
+the key with the lowest create_revision. Waiters watch only the key created
+right before their own, so a release wakes exactly one waiter instead of
+every client polling the prefix.
+"""
+import asyncio
+import logging
+import statistics
+import time
+from typing import Optional
+
+import grpc
+
+from kv_pb2 import Event, KeyValue
+from rpc_pb2 import (Compare, DeleteRangeRequest, LeaseGrantRequest, LeaseKeepAliveRequest,
+                     LeaseRevokeRequest, PutRequest, RangeRequest, RequestOp, TxnRequest,
+                     WatchCreateRequest, WatchRequest)
+from rpc_pb2_grpc import KVStub, LeaseStub, WatchStub
+from utils import prefix_range_end
+
+logger = logging.getLogger(__name__)
+
+
+class SessionExpired(Exception):
+    pass
+
+
+class NotLeader(Exception):
+    pass
+
+
+class Session:
+    """
+    A lease kept alive in the background for as long as the session is open.
+    The keepalive stream is reopened after errors; lost is set once the
+    lease is gone, i.e. etcd reports it expired or it could not be renewed
+    within its TTL. Whatever the session guards must stop at that point.
+    """
+
+    def __init__(self, channel, ttl: int = 60, retry_delay: float = 0.5) -> None:
+        self.channel = channel
+        self.ttl = ttl
+        self.retry_delay = retry_delay
+        self.kv = KVStub(channel)
+        self.watch = WatchStub(channel)
+        self.lease = LeaseStub(channel)
+        self.lease_id = 0
+        self.keepalive_task: Optional[asyncio.Task] = None
+        self.lost = asyncio.Event()
+
+    async def _renew(self) -> None:
+        """Returns when the lease is lost."""
+        # when the lease runs out unless renewed; measured from before the
+        # request, so it errs on the early side
+        deadline = time.monotonic() + self.ttl
+        delay = self.retry_delay
+        while True:
+            call = self.lease.LeaseKeepAlive()
+            try:
+                while True:
+                    sent = time.monotonic()
+                    await call.write(LeaseKeepAliveRequest(ID=self.lease_id))
+                    response = await call.read()
+                    if response is grpc.aio.EOF:
+                        break
+                    if response.TTL <= 0:
+                        return
+                    deadline = sent + response.TTL
+                    delay = self.retry_delay
+                    await asyncio.sleep(max(response.TTL / 3, 0.1))
+            except grpc.aio.AioRpcError as e:
+                logger.warning("lease %x keepalive failed: %s, retrying", self.lease_id, e.code().name)
+            except asyncio.InvalidStateError:
+                # write on a stream the server already ended
+                pass
+            finally:
+                call.cancel()
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, max(self.ttl / 3, self.retry_delay))
+
+    async def keepalive(self) -> None:
+        await self._renew()
+        logger.error("lease %x lost", self.lease_id)
+        self.lost.set()
+
+    async def open(self) -> "Session":
+        response = await self.lease.LeaseGrant(LeaseGrantRequest(TTL=self.ttl))
+        self.lease_id = response.ID
+        self.keepalive_task = asyncio.ensure_future(self.keepalive())
+        return self
+
+    async def close(self) -> None:
+        if self.keepalive_task is not None:
+            self.keepalive_task.cancel()
+            try:
+                await self.keepalive_task
+            except asyncio.CancelledError:
+                pass
+        if self.lost.is_set():
+            return
+        try:
+            await self.lease.LeaseRevoke(LeaseRevokeRequest(ID=self.lease_id))
+        except grpc.aio.AioRpcError as e:
+            if e.code() != grpc.StatusCode.NOT_FOUND:
+                raise
+
+    async def __aenter__(self) -> "Session":
+        return await self.open()
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+
+class Mutex:
+
+    def __init__(self, session: Session, prefix: bytes) -> None:
+        self.session = session
+        self.prefix = prefix.rstrip(b"/") + b"/"
+        self.range_end = prefix_range_end(self.prefix)
+        self.key = self.prefix + b"%x" % session.lease_id
+        self.revision = 0
+
+    def _owner_op(self) -> RequestOp:
+        return RequestOp(request_range=RangeRequest(
+            key=self.prefix, range_end=self.range_end, limit=1,
+            sort_order=RangeRequest.ASCEND, sort_target=RangeRequest.CREATE))
+
+    async def _wait_delete(self, key: bytes, revision: int) -> None:
+        call = self.session.watch.Watch()
+        try:
+            await call.write(WatchRequest(create_request=WatchCreateRequest(
+                key=key, start_revision=revision + 1, filters=[WatchCreateRequest.NOPUT])))
+            while True:
+                response = await call.read()
+                if response is grpc.aio.EOF:
+                    raise SessionExpired("watch stream closed")
+                if any(event.type == Event.DELETE for event in response.events):
+                    return
+        finally:
+            call.cancel()
+
+    async def _wait_predecessors(self) -> None:
+        while True:
+            response = await self.session.kv.Range(RangeRequest(
+                key=self.prefix, range_end=self.range_end, limit=1,
+                max_create_revision=self.revision - 1,
+                sort_order=RangeRequest.DESCEND, sort_target=RangeRequest.CREATE))
+            if not response.kvs:
+                return
+            await self._wait_delete(response.kvs[0].key, response.header.revision)
+
+    async def acquire(self, value: bytes = b"") -> None:
+        response = await self.session.kv.Txn(TxnRequest(
+            compare=[Compare(key=self.key, target=Compare.CREATE,
+                             result=Compare.EQUAL, create_revision=0)],
+            success=[RequestOp(request_put=PutRequest(
+                key=self.key, value=value, lease=self.session.lease_id)), self._owner_op()],
+            failure=[RequestOp(request_range=RangeRequest(key=self.key)), self._owner_op()],
+        ))
+        if response.succeeded:
+            self.revision = response.header.revision
+        else:
+            self.revision = response.responses[0].response_range.kvs[0].create_revision
+        owner = response.responses[1].response_range.kvs
+        if owner and owner[0].create_revision == self.revision:
+            return
+        try:
+            await self._wait_predecessors()
+            response = await self.session.kv.Range(RangeRequest(key=self.key))
+            if not response.kvs:
+                raise SessionExpired("lock key %r was removed while waiting" % self.key)
+        except BaseException:
+            await self.release()
+            raise
+
+    async def release(self) -> None:
+        # keys of a lost lease are gone already
+        if not self.session.lost.is_set():
+            await self.session.kv.DeleteRange(DeleteRangeRequest(key=self.key))
+        self.revision = 0
+
+    async def __aenter__(self) -> "Mutex":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.release()
+
+
+class Election(Mutex):
+    """Leader election on a prefix; the leader's key holds its proposal."""
+
+    async def campaign(self, value: bytes) -> None:
+        await self.acquire(value)
+
+    async def proclaim(self, value: bytes) -> None:
+        response = await self.session.kv.Txn(TxnRequest(
+            compare=[Compare(key=self.key, target=Compare.CREATE,
+                             result=Compare.EQUAL, create_revision=self.revision)],
+            success=[RequestOp(request_put=PutRequest(
+                key=self.key, value=value, lease=self.session.lease_id))],
+        ))
+        if not response.succeeded:
+            raise NotLeader(self.key)
+
+    async def resign(self) -> None:
+        await self.release()
+
+    async def leader(self) -> Optional[KeyValue]:
+        response = await self.session.kv.Range(self._owner_op().request_range)
+        return response.kvs[0] if response.kvs else None
+
+
+async def benchmark(endpoint: str = "localhost:2379", clients: int = 8, rounds: int = 50) -> None:
+    """Measures lock handoff under contention: every client locks the same prefix."""
+    waits = []
+
+    async def client(channel) -> None:
+        async with Session(channel, ttl=10) as session:
+            mutex = Mutex(session, b"/bench/lock")
+            for _ in range(rounds):
+                start = time.perf_counter()
+                await mutex.acquire()
+                waits.append(time.perf_counter() - start)
+                await mutex.release()
+
+    async with grpc.aio.insecure_channel(endpoint) as channel:
+        start = time.perf_counter()
+        await asyncio.gather(*[client(channel) for _ in range(clients)])
+        elapsed = time.perf_counter() - start
+
+    waits.sort()
+    print("%d clients x %d rounds: %.0f acquisitions/s" % (clients, rounds, len(waits) / elapsed))
+    print("acquire p50 %.2fms, p99 %.2fms" % (statistics.median(waits) * 1000,
+                                              waits[int(len(waits) * 0.99) - 1] * 1000))
+
+
+if __name__ == "__main__":
+    asyncio.run(benchmark())
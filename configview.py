@@ -0,0 +1,248 @@
+"""
+Read-only configuration snapshots of a prefix.
+
+A ConfigView loads the prefix once, page by page at a single revision, into
+an immutable ConfigSnapshot: a dict for O(1) lookups plus the sorted key list
+for prefix sub-views and ordered iteration. A watch then applies each batch
+of events to a copy of the current snapshot and swaps the copy in with one
+attribute assignment, so readers never block, never issue RPCs and never see
+half of an update. Code that reads several keys and needs them consistent
+should take view.snapshot once and read from it.
+"""
+import asyncio
+import bisect
+import json
+import logging
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+import grpc
+
+from kv_pb2 import Event
+from rpc_pb2 import WatchCreateRequest, WatchRequest
+from utils import prefix_range_end, to_bytes, to_string
+
+logger = logging.getLogger(__name__)
+
+Key = Union[str, bytes]
+MISSING = object()
+
+
+class ConfigSnapshot(Mapping[bytes, bytes]):
+    """
+    An immutable mapping of keys, relative to prefix, to values at one
+    revision. A sub-view shares the data of its parent and only narrows the
+    visible key range.
+    """
+
+    def __init__(self, values: Dict[bytes, bytes], keys: List[bytes], revision: int,
+                 prefix: bytes = b"") -> None:
+        self._values = values
+        self._keys = keys
+        self.revision = revision
+        self.prefix = prefix
+        if prefix:
+            self._start = bisect.bisect_left(keys, prefix)
+            self._stop = bisect.bisect_left(keys, prefix_range_end(prefix), self._start)
+        else:
+            self._start, self._stop = 0, len(keys)
+
+    def _key(self, key: Key) -> bytes:
+        return self.prefix + to_bytes(key)
+
+    def __getitem__(self, key: Key) -> bytes:
+        return self._values[self._key(key)]
+
+    def __contains__(self, key) -> bool:
+        return self._key(key) in self._values
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Keys relative to the view prefix, in key order."""
+        size = len(self.prefix)
+        for i in range(self._start, self._stop):
+            yield self._keys[i][size:]
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def sub(self, prefix: Key) -> "ConfigSnapshot":
+        """The keys under prefix, looked up relative to it."""
+        return ConfigSnapshot(self._values, self._keys, self.revision, self._key(prefix))
+
+    def _typed(self, key: Key, convert: Callable[[str], Any], default: Any) -> Any:
+        value = self._values.get(self._key(key), MISSING)
+        if value is MISSING:
+            if default is MISSING:
+                raise KeyError(key)
+            return default
+        try:
+            return convert(to_string(value))
+        except ValueError as e:
+            raise ValueError("%s: %s" % (to_string(self._key(key)), e))
+
+    def get_str(self, key: Key, default: Any = MISSING) -> str:
+        return self._typed(key, str, default)
+
+    def get_int(self, key: Key, default: Any = MISSING) -> int:
+        return self._typed(key, int, default)
+
+    def get_float(self, key: Key, default: Any = MISSING) -> float:
+        return self._typed(key, float, default)
+
+    def get_bool(self, key: Key, default: Any = MISSING) -> bool:
+        return self._typed(key, parse_bool, default)
+
+    def get_json(self, key: Key, default: Any = MISSING) -> Any:
+        return self._typed(key, json.loads, default)
+
+    def apply(self, changes: Iterable[Tuple[bytes, Optional[bytes]]], revision: int) -> "ConfigSnapshot":
+        """
+        A new snapshot with the (key, value) changes applied, None deleting
+        the key; this one is left untouched.
+        """
+        values = dict(self._values)
+        added = False
+        for key, value in changes:
+            if value is None:
+                values.pop(key, None)
+            else:
+                added = added or key not in values
+                values[key] = value
+        if added or len(values) != len(self._values):
+            keys = sorted(values)
+        else:
+            keys = self._keys
+        return ConfigSnapshot(values, keys, revision, self.prefix)
+
+
+def parse_bool(value: str) -> bool:
+    lowered = value.strip().lower()
+    if lowered in ("1", "true", "yes", "on"):
+        return True
+    if lowered in ("0", "false", "no", "off", ""):
+        return False
+    raise ValueError("not a boolean: %r" % value)
+
+
+class ConfigView:
+    """
+    The configuration under a prefix, kept current by a watch while started.
+    Lookups go to the current snapshot, with keys relative to the prefix.
+    """
+
+    def __init__(self, etcd, watch, prefix: Key = b"", page_size: int = 1000,
+                 retry_delay: float = 1.0) -> None:
+        self.etcd = etcd
+        # rpc_pb2_grpc.WatchStub on the same cluster
+        self.watch = watch
+        self.prefix = to_bytes(prefix)
+        self.range_end = prefix_range_end(self.prefix) if self.prefix else b"\0"
+        self.key = self.prefix or b"\0"
+        self.page_size = page_size
+        self.retry_delay = retry_delay
+        self.snapshot = ConfigSnapshot({}, [], 0, self.prefix)
+        self.task: Optional[asyncio.Task] = None
+        self._swapped = asyncio.Event()
+
+    def _decode(self, key: bytes, value: bytes) -> Optional[bytes]:
+        """The plain value, or None when it cannot be decrypted; such keys are left out."""
+        codec = getattr(self.etcd, "codec", None)
+        if codec is None:
+            return value
+        try:
+            return codec.decode(key, value)
+        except ValueError as e:
+            logger.error("config %s", e)
+            return None
+
+    def _swap(self, snapshot: ConfigSnapshot) -> None:
+        self.snapshot = snapshot
+        swapped, self._swapped = self._swapped, asyncio.Event()
+        swapped.set()
+
+    async def load(self) -> ConfigSnapshot:
+        values: Dict[bytes, bytes] = {}
+        keys: List[bytes] = []
+        revision = 0
+        async for response in self.etcd.scan(self.key, self.range_end, page_size=self.page_size):
+            revision = revision or response.header.revision
+            for item in response.kvs:
+                value = self._decode(item.key, item.value)
+                if value is not None:
+                    keys.append(item.key)
+                    values[item.key] = value
+        self._swap(ConfigSnapshot(values, keys, revision, self.prefix))
+        return self.snapshot
+
+    async def _watch_once(self) -> None:
+        call = self.watch.Watch()
+        try:
+            await call.write(WatchRequest(create_request=WatchCreateRequest(
+                key=self.key, range_end=self.range_end, start_revision=self.snapshot.revision + 1)))
+            while True:
+                response = await call.read()
+                if response is grpc.aio.EOF:
+                    await asyncio.sleep(self.retry_delay)
+                    return
+                if response.compact_revision or response.canceled:
+                    # the events since our revision are gone, start over
+                    await self.load()
+                    return
+                if not response.events:
+                    continue
+                changes = [(event.kv.key, None if event.type == Event.DELETE
+                            else self._decode(event.kv.key, event.kv.value))
+                           for event in response.events]
+                self._swap(self.snapshot.apply(changes, response.events[-1].kv.mod_revision))
+        finally:
+            call.cancel()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._watch_once()
+            except grpc.aio.AioRpcError as e:
+                logger.warning("config watch on %r failed: %s, retrying", self.prefix, e.code().name)
+                await asyncio.sleep(self.retry_delay)
+            except Exception:
+                logger.exception("config watch on %r failed, retrying", self.prefix)
+                await asyncio.sleep(self.retry_delay)
+
+    async def start(self) -> "ConfigView":
+        await self.load()
+        self.task = asyncio.ensure_future(self._run())
+        return self
+
+    async def stop(self) -> None:
+        if self.task is not None:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+            self.task = None
+
+    async def __aenter__(self) -> "ConfigView":
+        return await self.start()
+
+    async def __aexit__(self, *exc) -> None:
+        await self.stop()
+
+    async def updated(self) -> ConfigSnapshot:
+        """Waits for the next snapshot swap and returns the new snapshot."""
+        await self._swapped.wait()
+        return self.snapshot
+
+    def __getitem__(self, key: Key) -> bytes:
+        return self.snapshot[key]
+
+    def __contains__(self, key) -> bool:
+        return key in self.snapshot
+
+    def __len__(self) -> int:
+        return len(self.snapshot)
+
+    def get(self, key: Key, default: Optional[bytes] = None) -> Optional[bytes]:
+        return self.snapshot.get(key, default)
+
+    def sub(self, prefix: Key) -> ConfigSnapshot:
+        return self.snapshot.sub(prefix)
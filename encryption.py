@@ -0,0 +1,137 @@
+"""
+Client-side encryption of values.
+
+The keyring is a JSON file:
+
+    {
+        "master_key": "<base64, 32 bytes>",
+        "algorithm": "aes-gcm",
+        "prefixes": ["/secrets/", "/app/credentials/"]
+    }
+
+Values under a listed prefix are sealed with an AEAD cipher (AES-256-GCM or
+ChaCha20-Poly1305) keyed by HKDF(master_key, info=prefix), with the etcd key
+as associated data so a ciphertext cannot be moved to another key. Derived
+keys and cipher objects are cached per prefix. Requires the optional
+`cryptography` package.
+
+A sealed value is MAGIC, the algorithm id, the length of the prefix its key
+was derived from (2 bytes, big endian), the nonce and the ciphertext. The
+prefix is read back from the etcd key, so adding or removing prefixes in the
+keyring never strands existing values. Values written before the prefix
+length was recorded (LEGACY_MAGIC) use the longest matching prefix.
+"""
+import base64
+import json
+import os
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    from cryptography.exceptions import InvalidTag
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM, ChaCha20Poly1305
+    from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+except ImportError:
+    AESGCM = ChaCha20Poly1305 = None
+    InvalidTag = Exception
+
+MAGIC = b"\x00enc2"
+LEGACY_MAGIC = b"\x00enc1"
+NONCE_SIZE = 12
+TAG_SIZE = 16
+ALGORITHMS = {"aes-gcm": 1, "chacha20": 2}
+
+
+class DecryptionError(ValueError):
+    pass
+
+
+class ValueCodec:
+
+    def __init__(self, master_key: bytes, prefixes: Sequence[bytes], algorithm: str = "aes-gcm") -> None:
+        if AESGCM is None:
+            raise RuntimeError("value encryption requires the cryptography package")
+        if algorithm not in ALGORITHMS:
+            raise ValueError("Unknown algorithm: %s" % algorithm)
+        self.master_key = master_key
+        self.algorithm = algorithm
+        if any(len(prefix) > 0xffff for prefix in prefixes):
+            raise ValueError("Keyring prefixes must be shorter than 64KiB")
+        # longest prefix first, so the most specific one wins
+        self.prefixes = sorted(prefixes, key=len, reverse=True)
+        self.ciphers: Dict[Tuple[int, bytes], object] = {}
+
+    @classmethod
+    def from_keyring(cls, path: str) -> "ValueCodec":
+        with open(path, encoding="utf8") as f:
+            keyring = json.load(f)
+        return cls(base64.b64decode(keyring["master_key"]),
+                   [prefix.encode("utf8") for prefix in keyring.get("prefixes", [])],
+                   keyring.get("algorithm", "aes-gcm"))
+
+    def prefix(self, key: bytes) -> Optional[bytes]:
+        for prefix in self.prefixes:
+            if key.startswith(prefix):
+                return prefix
+        return None
+
+    def cipher(self, algorithm_id: int, prefix: bytes):
+        cipher = self.ciphers.get((algorithm_id, prefix))
+        if cipher is None:
+            derived = HKDF(algorithm=hashes.SHA256(), length=32, salt=None,
+                           info=b"etcd3-cli-value:" + prefix).derive(self.master_key)
+            cipher = AESGCM(derived) if algorithm_id == 1 else ChaCha20Poly1305(derived)
+            self.ciphers[(algorithm_id, prefix)] = cipher
+        return cipher
+
+    def encode(self, key: bytes, value: bytes) -> bytes:
+        return self.encode_many([(key, value)])[0]
+
+    def encode_many(self, items: Sequence[Tuple[bytes, bytes]]) -> List[bytes]:
+        """Encrypts a batch of (key, value) pairs with one call for all nonces."""
+        algorithm_id = ALGORITHMS[self.algorithm]
+        nonces = os.urandom(NONCE_SIZE * len(items))
+        header = MAGIC + bytes([algorithm_id])
+        values = []
+        for i, (key, value) in enumerate(items):
+            prefix = self.prefix(key)
+            if prefix is None:
+                values.append(value)
+                continue
+            nonce = nonces[i * NONCE_SIZE:(i + 1) * NONCE_SIZE]
+            values.append(header + len(prefix).to_bytes(2, "big") + nonce +
+                          self.cipher(algorithm_id, prefix).encrypt(nonce, value, key))
+        return values
+
+    def decode(self, key: bytes, value: bytes) -> bytes:
+        """
+        Decrypts a value. Values without the encryption header are returned
+        unchanged, so a prefix can be encrypted gradually. Raises
+        DecryptionError when the master key cannot open the value.
+        """
+        if value.startswith(MAGIC):
+            start = len(MAGIC) + 3
+            if len(value) < start + NONCE_SIZE + TAG_SIZE:
+                raise DecryptionError("Cannot decrypt %r: value is too short" % key)
+            prefix_length = int.from_bytes(value[len(MAGIC) + 1:start], "big")
+            if prefix_length > len(key):
+                raise DecryptionError("Cannot decrypt %r: prefix length %d is longer than the key"
+                                      % (key, prefix_length))
+            prefix = key[:prefix_length]
+        elif value.startswith(LEGACY_MAGIC):
+            prefix = self.prefix(key)
+            if prefix is None:
+                return value
+            start = len(LEGACY_MAGIC) + 1
+            if len(value) < start + NONCE_SIZE + TAG_SIZE:
+                raise DecryptionError("Cannot decrypt %r: value is too short" % key)
+        else:
+            return value
+        algorithm_id = value[len(MAGIC)]
+        if algorithm_id not in ALGORITHMS.values():
+            raise DecryptionError("Unknown algorithm id %d for %r" % (algorithm_id, key))
+        nonce = value[start:start + NONCE_SIZE]
+        try:
+            return self.cipher(algorithm_id, prefix).decrypt(nonce, value[start + NONCE_SIZE:], key)
+        except InvalidTag:
+            raise DecryptionError("Cannot decrypt %r: wrong keyring or corrupted value" % key) from None
@@ -0,0 +1,93 @@
+"""
+Range export with decoding moved to a process pool.
+
+One async reader pages through the range with a RawKVStub that returns
+serialized RangeResponse bytes; it only walks the wire format far enough to
+find the next page. Each page is handed to a worker process that parses,
+filters and formats it and appends the result to that worker's shard file.
+
+Keys and values that are not valid UTF-8 (binary data, encrypted values) are
+written in base64 with a "key_encoding" or "value_encoding": "base64" field.
+"""
+import asyncio
+import base64
+import json
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional
+
+from rpc_pb2 import RangeResponse
+from serialization import RawKVStub, RequestEncoder, scan_range_response
+
+
+def _set_field(record: Dict, name: str, data: bytes) -> None:
+    try:
+        record[name] = data.decode("utf8")
+    except UnicodeDecodeError:
+        record[name] = base64.b64encode(data).decode("ascii")
+        record[name + "_encoding"] = "base64"
+
+
+def export_page(data: bytes, out_dir: str, match: Optional[str] = None) -> int:
+    """Runs in a worker process. Returns the number of records written."""
+    pattern = re.compile(match.encode("utf8")) if match else None
+    lines = []
+    for item in RangeResponse.FromString(data).kvs:
+        if pattern is not None and not pattern.search(item.key):
+            continue
+        record = {}
+        _set_field(record, "key", item.key)
+        _set_field(record, "value", item.value)
+        record.update(create_revision=item.create_revision, mod_revision=item.mod_revision,
+                      version=item.version, lease=item.lease)
+        lines.append(json.dumps(record))
+    if lines:
+        path = os.path.join(out_dir, "part-%d.jsonl" % os.getpid())
+        with open(path, "a", encoding="utf8") as f:
+            f.write("\n".join(lines) + "\n")
+    return len(lines)
+
+
+async def export_range(channel, key: bytes, range_end: bytes, out_dir: str,
+                       workers: Optional[int] = None, page_size: int = 1000,
+                       match: Optional[str] = None) -> int:
+    """
+    Exports [key, range_end) at a single revision into out_dir/part-<pid>.jsonl
+    files and returns the number of records written. out_dir must be empty
+    or missing, shards are appended to and would mix with an earlier export.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    if os.listdir(out_dir):
+        raise FileExistsError("%s is not empty" % out_dir)
+    stub = RawKVStub(channel, decode_ranges=False)
+    encoder = RequestEncoder()
+    loop = asyncio.get_running_loop()
+    written = 0
+    revision = 0
+    # workers are spawned rather than forked, forking a process with live
+    # gRPC threads is not safe
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        # keep a bounded number of pages queued so the reader cannot run
+        # arbitrarily far ahead of the workers
+        pending = set()
+        limit = 2 * (workers or os.cpu_count() or 1)
+        while True:
+            data = await stub.Range(encoder.range(
+                key=key, range_end=range_end, limit=page_size, revision=revision))
+            page_revision, last_key, more, count = scan_range_response(data)
+            revision = revision or page_revision
+            if count:
+                pending.add(loop.run_in_executor(pool, export_page, data, out_dir, match))
+            if len(pending) >= limit:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                written += sum(future.result() for future in done)
+            if not more or last_key is None:
+                break
+            key = last_key + b"\0"
+        if pending:
+            done, _ = await asyncio.wait(pending)
+            written += sum(future.result() for future in done)
+    return written
@@ -0,0 +1,70 @@
+"""
+Differences between two revisions of a range.
+
+Three snapshots of the range are streamed page by page, all in key order:
+
+    before   at from_rev, keys only
+    after    at to_rev, keys only
+    changed  at to_rev with min_mod_revision=from_rev + 1, values included
+
+Keys left untouched since from_rev are pruned by the server from the only
+stream that carries values, and a merge-join over the three finds added,
+removed and changed keys holding at most one page of each in memory.
+"""
+from typing import AsyncIterator, Optional, Tuple
+
+from kv_pb2 import KeyValue
+
+ADDED = "added"
+REMOVED = "removed"
+CHANGED = "changed"
+
+
+async def _items(pages) -> AsyncIterator[KeyValue]:
+    async for response in pages:
+        for item in response.kvs:
+            yield item
+
+
+async def _next(items: AsyncIterator[KeyValue]) -> Optional[KeyValue]:
+    try:
+        return await items.__anext__()
+    except StopAsyncIteration:
+        return None
+
+
+async def current_revision(etcd, key: bytes, range_end: bytes) -> int:
+    response = await etcd.range(key, range_end, count_only=True)
+    return response.header.revision
+
+
+async def diff_revisions(etcd, key: bytes, range_end: bytes, from_rev: int, to_rev: int = 0,
+                         page_size: int = 1000) -> AsyncIterator[Tuple[str, KeyValue]]:
+    """
+    Yields (ADDED | REMOVED | CHANGED, item) in key order. Added and changed
+    items are the values at to_rev, removed items are keys only. A key
+    written again after from_rev counts as changed even if its value is the
+    same. to_rev=0 means the current revision.
+    """
+    to_rev = to_rev or await current_revision(etcd, key, range_end)
+    if from_rev >= to_rev:
+        raise ValueError("--from-rev (%d) must be lower than --to-rev (%d)" % (from_rev, to_rev))
+    before = _items(etcd.scan(key, range_end, page_size, revision=from_rev, keys_only=True))
+    after = _items(etcd.scan(key, range_end, page_size, revision=to_rev, keys_only=True))
+    changed = _items(etcd.scan(key, range_end, page_size, revision=to_rev,
+                               min_mod_revision=from_rev + 1))
+    old, new, value = await _next(before), await _next(after), await _next(changed)
+    while old is not None or new is not None:
+        if new is None or (old is not None and old.key < new.key):
+            yield REMOVED, old
+            old = await _next(before)
+            continue
+        existed = old is not None and old.key == new.key
+        if new.mod_revision > from_rev:
+            # changed holds exactly the keys of after modified since from_rev
+            while value is not None and value.key < new.key:
+                value = await _next(changed)
+            yield (CHANGED if existed else ADDED), (value if value is not None and value.key == new.key else new)
+        if existed:
+            old = await _next(before)
+        new = await _next(after)
@@ -0,0 +1,202 @@
+"""
+Bulk import of key/value snapshot files through a memory map.
+
+Records are parsed lazily from the mapped file and handed to the writer as
+memoryview slices where the format allows it, so keys and values are copied
+once, into the request buffer. Pages already imported are dropped from
+memory as the import goes, which keeps the resident set small whatever the
+file size.
+
+Supported formats:
+    jsonl  {"key": "...", "value": "..."} per line, as written by export,
+           base64 where "key_encoding"/"value_encoding" is "base64"
+    csv    key,value per line
+    pb     varint length-prefixed mvccpb.KeyValue messages
+"""
+import asyncio
+import base64
+import csv
+import json
+import mmap
+import os
+from typing import Dict, Iterator, Optional, Tuple
+
+from serialization import RawKVStub, RequestEncoder, iter_delimited_key_values
+
+# how much of the file is imported between two MADV_DONTNEED calls
+RELEASE_INTERVAL = 64 << 20
+
+
+def detect_format(path: str) -> str:
+    extension = os.path.splitext(path)[1].lower()
+    if extension in (".jsonl", ".ndjson"):
+        return "jsonl"
+    if extension == ".csv":
+        return "csv"
+    if extension in (".pb", ".bin"):
+        return "pb"
+    raise ValueError("Cannot detect the format of %s, use --format" % path)
+
+
+class MappedFile:
+    """A read-only memory map of a file with a memoryview over it."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.mapped: Optional[mmap.mmap] = None
+        self.view = memoryview(b"")
+        self.released = 0
+        # number of the line last returned by lines()
+        self.lineno = 0
+
+    def __enter__(self) -> "MappedFile":
+        with open(self.path, "rb") as f:
+            if os.fstat(f.fileno()).st_size:
+                self.mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.mapped is not None:
+            if hasattr(self.mapped, "madvise"):
+                self.mapped.madvise(mmap.MADV_SEQUENTIAL)
+            self.view = memoryview(self.mapped)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.view.release()
+        if self.mapped is not None:
+            self.mapped.close()
+
+    def find(self, sub: bytes, start: int, end: int) -> int:
+        return self.mapped.find(sub, start, end)
+
+    def done_until(self, pos: int) -> None:
+        """Lets the kernel drop the pages before pos, they are not read again."""
+        if not hasattr(self.mapped, "madvise") or pos - self.released < RELEASE_INTERVAL:
+            return
+        until = pos - pos % mmap.PAGESIZE
+        self.mapped.madvise(mmap.MADV_DONTNEED, self.released, until - self.released)
+        self.released = until
+
+    def lines(self) -> Iterator[Tuple[int, int]]:
+        """Yields (start, end) offsets of non-empty lines."""
+        pos, size = 0, len(self.view)
+        while pos < size:
+            self.lineno += 1
+            end = self.find(b"\n", pos, size)
+            if end < 0:
+                end = size
+            start, pos = pos, end + 1
+            if end > start and self.view[end - 1] == 0x0d:
+                end -= 1
+            if end > start:
+                yield start, end
+            self.done_until(pos)
+
+
+def _field(record: Dict, name: str, default: Optional[str] = None) -> bytes:
+    value = record[name] if default is None else record.get(name, default)
+    if record.get(name + "_encoding") == "base64":
+        return base64.b64decode(value)
+    return value.encode("utf8")
+
+
+def iter_jsonl(mapped: MappedFile) -> Iterator[Tuple[bytes, bytes]]:
+    for start, end in mapped.lines():
+        try:
+            record = json.loads(mapped.view[start:end].tobytes())
+            key, value = _field(record, "key"), _field(record, "value", "")
+        except KeyError as e:
+            raise ValueError("%s:%d: missing field %s" % (mapped.path, mapped.lineno, e))
+        except (ValueError, TypeError, AttributeError) as e:
+            raise ValueError("%s:%d: %s" % (mapped.path, mapped.lineno, e))
+        yield key, value
+
+
+def iter_csv(mapped: MappedFile) -> Iterator[Tuple[memoryview, memoryview]]:
+    view = mapped.view
+    for start, end in mapped.lines():
+        if mapped.find(b'"', start, end) >= 0:
+            # quoted fields go through the csv module
+            row = next(csv.reader([view[start:end].tobytes().decode("utf8")]))
+            yield row[0].encode("utf8"), (row[1] if len(row) > 1 else "").encode("utf8")
+            continue
+        comma = mapped.find(b",", start, end)
+        if comma < 0:
+            yield view[start:end], view[end:end]
+        else:
+            yield view[start:comma], view[comma + 1:end]
+
+
+def iter_pb(mapped: MappedFile) -> Iterator[Tuple[memoryview, memoryview]]:
+    records = iter_delimited_key_values(mapped.view)
+    while True:
+        try:
+            key, value, end = next(records)
+        except StopIteration:
+            return
+        except ValueError as e:
+            raise ValueError("%s: %s" % (mapped.path, e))
+        yield key, value
+        mapped.done_until(end)
+
+
+READERS = {"jsonl": iter_jsonl, "csv": iter_csv, "pb": iter_pb}
+
+
+class ImportResult:
+
+    def __init__(self) -> None:
+        self.written = 0
+        self.failed = 0
+        self.error: Optional[BaseException] = None
+        # set when reading the file failed; the records before it were imported
+        self.read_error: Optional[ValueError] = None
+
+
+async def import_records(channel, records: Iterator[Tuple[bytes, bytes]], concurrency: int = 64,
+                         codec=None) -> ImportResult:
+    """
+    Writes records with at most concurrency puts in flight. Puts of the
+    same key are issued in file order. A ValueError from records stops the
+    import after the puts in flight and is kept in result.read_error.
+    """
+    stub = RawKVStub(channel)
+    encoder = RequestEncoder()
+    semaphore = asyncio.Semaphore(concurrency)
+    # only keys with a put in flight, so this stays bounded by concurrency
+    inflight: Dict[bytes, asyncio.Future] = {}
+    result = ImportResult()
+
+    def done(task: asyncio.Future, key: bytes) -> None:
+        semaphore.release()
+        if inflight.get(key) is task:
+            del inflight[key]
+        if task.cancelled() or task.exception() is not None:
+            result.failed += 1
+            result.error = result.error or (task.exception() if not task.cancelled() else None)
+        else:
+            result.written += 1
+
+    records = iter(records)
+    while True:
+        try:
+            key, value = next(records)
+        except StopIteration:
+            break
+        except ValueError as e:
+            # keep only the message, the traceback would pin slices of the
+            # mapped file and keep it from being closed
+            result.read_error = ValueError(str(e))
+            break
+        key = bytes(key)
+        if codec is not None:
+            value = codec.encode(key, bytes(value))
+        request = encoder.put(key=key, value=value)
+        previous = inflight.get(key)
+        if previous is not None:
+            await asyncio.wait([previous])
+        await semaphore.acquire()
+        task = asyncio.ensure_future(stub.Put(request))
+        task.add_done_callback(lambda task, key=key: done(task, key))
+        inflight[key] = task
+    for _ in range(concurrency):
+        await semaphore.acquire()
+    return result
@@ -0,0 +1,162 @@
+import os
+from typing import Dict, List, Optional, Tuple
+
+from utils import prefix_range_end
+
+
+class _Node:
+    __slots__ = ("label", "children", "terminal", "count")
+
+    def __init__(self, label: bytes) -> None:
+        self.label = label
+        self.children: Dict[int, "_Node"] = {}
+        self.terminal = False
+        # number of keys stored in this subtree
+        self.count = 0
+
+
+class KeyTrie:
+    """
+    Compact (radix) trie of keys. Each edge holds a run of bytes and every
+    node knows how many keys live below it, so prefix counts are a walk.
+    """
+
+    def __init__(self) -> None:
+        self.root = _Node(b"")
+
+    def __len__(self) -> int:
+        return self.root.count
+
+    def __contains__(self, key: bytes) -> bool:
+        node, tail = self.find(key)
+        return node is not None and not tail and node.terminal
+
+    def insert(self, key: bytes) -> bool:
+        node, path, i = self.root, [self.root], 0
+        while i < len(key):
+            child = node.children.get(key[i])
+            if child is None:
+                child = _Node(key[i:])
+                node.children[key[i]] = child
+                node, i = child, len(key)
+                path.append(node)
+                break
+            label = child.label
+            n = len(os.path.commonprefix([label, key[i:i + len(label)]]))
+            if n < len(label):
+                # split the edge at the first differing byte
+                mid = _Node(label[:n])
+                mid.count = child.count
+                child.label = label[n:]
+                mid.children[child.label[0]] = child
+                node.children[key[i]] = mid
+                child = mid
+            node, i = child, i + n
+            path.append(node)
+        if node.terminal:
+            return False
+        node.terminal = True
+        for item in path:
+            item.count += 1
+        return True
+
+    def find(self, prefix: bytes) -> Tuple[Optional[_Node], bytes]:
+        """
+        Returns the shallowest node whose path starts with prefix, and the
+        part of that path beyond prefix.
+        """
+        node, i = self.root, 0
+        while i < len(prefix):
+            child = node.children.get(prefix[i])
+            if child is None:
+                return None, b""
+            rest = prefix[i:]
+            if rest.startswith(child.label):
+                node, i = child, i + len(child.label)
+            elif child.label.startswith(rest):
+                return child, child.label[len(rest):]
+            else:
+                return None, b""
+        return node, b""
+
+    def count(self, prefix: bytes) -> int:
+        node, _ = self.find(prefix)
+        return node.count if node is not None else 0
+
+    def children(self, prefix: bytes, separator: bytes = b"/") -> List[Tuple[bytes, int]]:
+        """
+        Lists the immediate children of prefix: keys without a further
+        separator, and "directories" ending in separator with the number of
+        keys below them.
+        """
+        node, tail = self.find(prefix)
+        if node is None:
+            return []
+        entries: Dict[bytes, int] = {}
+        stack = [(node, tail)]
+        while stack:
+            node, suffix = stack.pop()
+            index = suffix.find(separator)
+            if index >= 0:
+                name = prefix + suffix[:index + len(separator)]
+                entries[name] = entries.get(name, 0) + node.count
+                continue
+            if node.terminal and suffix:
+                entries[prefix + suffix] = entries.get(prefix + suffix, 0) + 1
+            for child in node.children.values():
+                stack.append((child, suffix + child.label))
+        return sorted(entries.items())
+
+
+class KeyIndex:
+    """
+    KeyTrie of a prefix kept in sync with etcd by revision. A refresh only
+    fetches keys modified after the indexed revision; deletions are detected
+    by comparing counts and trigger a full rebuild.
+    """
+
+    def __init__(self, etcd, prefix: bytes = b"", page_size: int = 1000) -> None:
+        self.etcd = etcd
+        self.prefix = prefix
+        self.range_end = prefix_range_end(prefix) if prefix else b"\0"
+        # etcd rejects an empty key, b"\0" to b"\0" is the whole keyspace
+        self.key = prefix or b"\0"
+        self.page_size = page_size
+        self.trie = KeyTrie()
+        self.revision = 0
+
+    async def _scan(self, **options) -> int:
+        revision = 0
+        async for response in self.etcd.scan(self.key, self.range_end,
+                                             page_size=self.page_size,
+                                             keys_only=True, **options):
+            revision = response.header.revision
+            for item in response.kvs:
+                self.trie.insert(item.key)
+        return revision
+
+    async def load(self) -> None:
+        self.trie = KeyTrie()
+        self.revision = await self._scan()
+
+    async def refresh(self) -> None:
+        if not self.revision:
+            await self.load()
+            return
+        response = await self.etcd.range(self.key, self.range_end, count_only=True)
+        revision = response.header.revision
+        if revision == self.revision:
+            return
+        await self._scan(revision=revision, min_mod_revision=self.revision + 1)
+        if len(self.trie) != response.count:
+            await self.load()
+            return
+        self.revision = revision
+
+    def count(self, prefix: bytes) -> int:
+        return self.trie.count(prefix)
+
+    def ls(self, path: bytes, separator: bytes = b"/") -> List[Tuple[bytes, int]]:
+        if path and not path.endswith(separator):
+            path += separator
+        return self.trie.children(path, separator)
@@ -0,0 +1,66 @@
+from typing import AsyncIterator, List, Tuple
+
+import grpc
+
+from rpc_pb2 import (CompactionRequest, DefragmentRequest, HashKVRequest, HashKVResponse,
+                     MemberListRequest, RangeRequest, StatusRequest, StatusResponse)
+from rpc_pb2_grpc import ClusterStub, KVStub, MaintenanceStub
+
+
+def client_endpoint(url: str) -> str:
+    """Turns a member client URL such as http://10.0.0.1:2379 into a gRPC target."""
+    return url.split("://", 1)[-1].rstrip("/")
+
+
+async def member_endpoints(channel) -> List[Tuple[str, str]]:
+    """Returns (member name, endpoint) for every started member."""
+    response = await ClusterStub(channel).MemberList(MemberListRequest())
+    return [(member.name, client_endpoint(member.clientURLs[0]))
+            for member in response.members if member.clientURLs]
+
+
+async def compact(channel, keep: int, physical: bool = False) -> Tuple[int, int]:
+    """
+    Compacts history up to the current revision minus keep. Returns
+    (compacted revision, current revision); nothing is compacted, and the
+    compacted revision is 0, when there are fewer than keep revisions or
+    that revision is compacted already.
+    """
+    kv = KVStub(channel)
+    response = await kv.Range(RangeRequest(key=b"\0", count_only=True))
+    current = response.header.revision
+    revision = current - keep
+    if revision <= 0:
+        return 0, current
+    try:
+        await kv.Compact(CompactionRequest(revision=revision, physical=physical))
+    except grpc.aio.AioRpcError as e:
+        # "required revision has been compacted"
+        if e.code() != grpc.StatusCode.OUT_OF_RANGE:
+            raise
+        return 0, current
+    return revision, current
+
+
+async def status(endpoint: str) -> StatusResponse:
+    async with grpc.aio.insecure_channel(endpoint) as channel:
+        return await MaintenanceStub(channel).Status(StatusRequest())
+
+
+async def hash_kv(endpoint: str, revision: int = 0) -> HashKVResponse:
+    async with grpc.aio.insecure_channel(endpoint) as channel:
+        return await MaintenanceStub(channel).HashKV(HashKVRequest(revision=revision))
+
+
+async def defragment(endpoints: List[Tuple[str, str]]) -> AsyncIterator[Tuple[str, int, int]]:
+    """
+    Defragments members one at a time, so at most one member is blocked
+    at any moment, and yields (name, db size before, db size after).
+    """
+    for name, endpoint in endpoints:
+        async with grpc.aio.insecure_channel(endpoint) as channel:
+            maintenance = MaintenanceStub(channel)
+            before = await maintenance.Status(StatusRequest())
+            await maintenance.Defragment(DefragmentRequest())
+            after = await maintenance.Status(StatusRequest())
+        yield name, before.dbSize, after.dbSize
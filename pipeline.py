@@ -0,0 +1,208 @@
+import asyncio
+import bisect
+import json
+import time
+from typing import Callable, Dict, List, Optional
+
+from serialization import RequestEncoder
+from rpc_pb2 import PutRequest, RangeRequest, DeleteRangeRequest
+from utils import to_bytes, prefix_range_end
+
+
+class Operation:
+
+    def __init__(self, method: str, key: bytes, range_end: bytes = b"",
+                 value: bytes = b"", limit: int = 0) -> None:
+        self.method = method
+        self.key = key
+        self.range_end = range_end or b""
+        self.value = value
+        self.limit = limit
+        self.result = None
+        self.error: Optional[Exception] = None
+        self.elapsed = 0.0
+        # index of the later put that made this one redundant
+        self.coalesced_into: Optional[int] = None
+
+    @classmethod
+    def from_dict(cls, item: Dict) -> "Operation":
+        method = item["op"]
+        if method not in ("get", "put", "del"):
+            raise ValueError("Unknown op: %s" % method)
+        key = to_bytes(item["key"])
+        range_end = to_bytes(item.get("range_end"))
+        if item.get("prefix"):
+            range_end = prefix_range_end(key)
+        return cls(method, key, range_end, to_bytes(item.get("value", b"")),
+                   item.get("limit", 0))
+
+    @property
+    def is_write(self) -> bool:
+        return self.method != "get"
+
+    @property
+    def end(self) -> Optional[bytes]:
+        """Exclusive end of the touched interval, None when unbounded."""
+        if not self.range_end:
+            return self.key + b"\0"
+        if self.range_end == b"\0":
+            return None
+        return self.range_end
+
+    def overlaps(self, other: "Operation") -> bool:
+        return ((self.end is None or other.key < self.end) and
+                (other.end is None or self.key < other.end))
+
+    def conflicts(self, other: "Operation") -> bool:
+        return (self.is_write or other.is_write) and self.overlaps(other)
+
+
+def parse_jsonl(line: str) -> Operation:
+    return Operation.from_dict(json.loads(line))
+
+
+class Segments:
+    """
+    The keyspace cut at the edges of the operations seen so far: segment i
+    is [starts[i], starts[i + 1]) and holds values[i]. Finding what an
+    operation overlaps costs a bisection per edge instead of a scan over
+    every earlier operation.
+    """
+
+    def __init__(self, value, copy: Callable = lambda value: value) -> None:
+        self.starts: List[bytes] = [b""]
+        self.values: List = [value]
+        self.copy = copy
+
+    def _split(self, key: bytes) -> int:
+        i = bisect.bisect_right(self.starts, key) - 1
+        if self.starts[i] != key:
+            i += 1
+            self.starts.insert(i, key)
+            self.values.insert(i, self.copy(self.values[i - 1]))
+        return i
+
+    def span(self, op: Operation) -> range:
+        """Indices of the segments that exactly cover the interval of op."""
+        end = op.end
+        first = self._split(op.key)
+        last = len(self.starts) if end is None else self._split(end)
+        return range(first, last)
+
+
+class Pipeline:
+    """
+    Runs operations concurrently on one stub. An operation waits only for
+    earlier operations that touch an overlapping range when either side
+    writes, so per-key order is kept. A put that is immediately followed by
+    another put of the same key is coalesced into it.
+    """
+
+    def __init__(self, stub, operations: List[Operation], concurrency: int = 64,
+                 raw_stub=None, codec=None) -> None:
+        self.stub = stub
+        # when given, requests are encoded by RequestEncoder and sent as bytes
+        self.raw_stub = raw_stub
+        self.encoder = RequestEncoder()
+        # optional encryption.ValueCodec applied to every put in one batch
+        self.codec = codec
+        self.operations = operations
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.elapsed = 0.0
+
+    def coalesce(self) -> None:
+        ops = self.operations
+        # walking backwards, each segment holds the next operation touching it
+        following = Segments(None)
+        for i in reversed(range(len(ops))):
+            op = ops[i]
+            span = following.span(op)
+            if op.method == "put":
+                j = min((following.values[s] for s in span if following.values[s] is not None),
+                        default=None)
+                if j is not None and ops[j].method == "put" and ops[j].key == op.key:
+                    op.coalesced_into = j
+            for s in span:
+                following.values[s] = i
+
+    async def _execute(self, op: Operation) -> None:
+        if self.raw_stub is not None:
+            await self._execute_raw(op)
+        elif op.method == "put":
+            op.result = await self.stub.Put(PutRequest(key=op.key, value=op.value))
+        elif op.method == "get":
+            op.result = await self.stub.Range(RangeRequest(
+                key=op.key, range_end=op.range_end, limit=op.limit))
+        else:
+            op.result = await self.stub.DeleteRange(DeleteRangeRequest(
+                key=op.key, range_end=op.range_end))
+
+    async def _execute_raw(self, op: Operation) -> None:
+        # encoding is synchronous, so the shared buffer is copied out before
+        # any other operation can touch it
+        if op.method == "put":
+            op.result = await self.raw_stub.Put(self.encoder.put(key=op.key, value=op.value))
+        elif op.method == "get":
+            op.result = await self.raw_stub.Range(self.encoder.range(
+                key=op.key, range_end=op.range_end, limit=op.limit))
+        else:
+            op.result = await self.raw_stub.DeleteRange(self.encoder.delete_range(
+                key=op.key, range_end=op.range_end))
+
+    async def _run(self, op: Operation, dependencies: List[asyncio.Task]) -> None:
+        if dependencies:
+            await asyncio.wait(dependencies)
+        async with self.semaphore:
+            start = time.perf_counter()
+            try:
+                await self._execute(op)
+            except Exception as e:
+                op.error = e
+            op.elapsed = time.perf_counter() - start
+
+    def encode_values(self) -> None:
+        puts = [op for op in self.operations if op.method == "put" and op.coalesced_into is None]
+        values = self.codec.encode_many([(op.key, op.value) for op in puts])
+        for op, value in zip(puts, values):
+            op.value = value
+
+    def decode_values(self) -> None:
+        """Decodes every value; a value that cannot be decoded fails only its operation."""
+        for op in self.operations:
+            if op.method == "get" and op.result is not None:
+                for item in op.result.kvs:
+                    try:
+                        item.value = self.codec.decode(item.key, item.value)
+                    except ValueError as e:
+                        op.error = op.error or e
+
+    async def run(self) -> List[Operation]:
+        self.coalesce()
+        if self.codec is not None:
+            self.encode_values()
+        start = time.perf_counter()
+        tasks: List[Optional[asyncio.Task]] = []
+        # per segment the last write and the reads issued after it; waiting
+        # for those orders an operation after every earlier conflicting one
+        touched = Segments([None, []], lambda value: [value[0], list(value[1])])
+        for i, op in enumerate(self.operations):
+            if op.coalesced_into is not None:
+                tasks.append(None)
+                continue
+            dependencies = set()
+            for s in touched.span(op):
+                write, reads = touched.values[s]
+                if write is not None:
+                    dependencies.add(write)
+                if op.is_write:
+                    dependencies.update(reads)
+                    touched.values[s] = [i, []]
+                else:
+                    reads.append(i)
+            tasks.append(asyncio.ensure_future(
+                self._run(op, [tasks[j] for j in sorted(dependencies)])))
+        await asyncio.gather(*[task for task in tasks if task is not None])
+        self.elapsed = time.perf_counter() - start
+        if self.codec is not None:
+            self.decode_values()
+        return self.operations
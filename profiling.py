@@ -0,0 +1,135 @@
+"""
+Tracing spans and an event-loop lag monitor for the CLI and library.
+
+Spans are recorded only while a Tracer is installed with start_tracing(),
+otherwise span() is a no-op. The trace is written in the Chrome trace event
+format (load it in chrome://tracing or https://ui.perfetto.dev); each asyncio
+task gets its own row so concurrent RPCs do not overlap.
+"""
+import asyncio
+import contextlib
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+tracer: Optional["Tracer"] = None
+
+
+class Tracer:
+
+    def __init__(self) -> None:
+        self.events: List[Dict] = []
+        self.pid = os.getpid()
+        self.tids: Dict[int, int] = {}
+        self.start = time.perf_counter()
+
+    def now(self) -> float:
+        """Microseconds since the tracer was created."""
+        return (time.perf_counter() - self.start) * 1e6
+
+    def tid(self) -> int:
+        try:
+            owner = id(asyncio.current_task())
+        except RuntimeError:
+            owner = threading.get_ident()
+        return self.tids.setdefault(owner, len(self.tids) + 1)
+
+    @contextlib.contextmanager
+    def span(self, name: str, category: str = "cli", **args):
+        start = self.now()
+        try:
+            yield
+        finally:
+            self.events.append({"name": name, "cat": category, "ph": "X", "ts": start,
+                                "dur": self.now() - start, "pid": self.pid,
+                                "tid": self.tid(), "args": args})
+
+    def counter(self, name: str, **values) -> None:
+        self.events.append({"name": name, "ph": "C", "ts": self.now(),
+                            "pid": self.pid, "args": values})
+
+    def dump(self, path: str) -> None:
+        with open(path, "w", encoding="utf8") as f:
+            json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, f)
+
+
+def start_tracing() -> Tracer:
+    global tracer
+    tracer = Tracer()
+    return tracer
+
+
+def span(name: str, category: str = "cli", **args):
+    if tracer is None:
+        return contextlib.nullcontext()
+    return tracer.span(name, category, **args)
+
+
+class LoopLagMonitor:
+    """
+    Measures how late the event loop wakes a task that sleeps for interval;
+    a large lag means something blocked the loop (e.g. protobuf decoding).
+    """
+
+    def __init__(self, interval: float = 0.01) -> None:
+        self.interval = interval
+        self.max_lag = 0.0
+        self.task: Optional[asyncio.Task] = None
+
+    async def _run(self) -> None:
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            lag = time.perf_counter() - start - self.interval
+            self.max_lag = max(self.max_lag, lag)
+            if tracer is not None:
+                tracer.counter("loop lag", lag_ms=lag * 1000)
+
+    def start(self) -> None:
+        self.task = asyncio.ensure_future(self._run())
+
+    def stop(self) -> None:
+        if self.task is not None:
+            self.task.cancel()
+
+
+def _traced(function, name: str):
+    def wrapper(message):
+        with span(name, "serialization"):
+            return function(message)
+    return wrapper
+
+
+class _TracedMultiCallable:
+
+    def __init__(self, call, method: str) -> None:
+        self.call = call
+        self.method = method
+
+    async def __call__(self, request, **kwargs):
+        with span(self.method, "rpc"):
+            return await self.call(request, **kwargs)
+
+
+class TracedChannel:
+    """
+    Channel wrapper for generated stubs: every unary call gets an "rpc" span
+    with nested "serialization" spans, so the remainder is network wait.
+    """
+
+    def __init__(self, channel) -> None:
+        self.channel = channel
+
+    def unary_unary(self, method, request_serializer=None, response_deserializer=None, **kwargs):
+        if request_serializer is not None:
+            request_serializer = _traced(request_serializer, "serialize")
+        if response_deserializer is not None:
+            response_deserializer = _traced(response_deserializer, "deserialize")
+        return _TracedMultiCallable(self.channel.unary_unary(
+            method, request_serializer=request_serializer,
+            response_deserializer=response_deserializer, **kwargs), method)
+
+    def __getattr__(self, name):
+        return getattr(self.channel, name)
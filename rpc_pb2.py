@@ -20,7 +20,7 @@ DESCRIPTOR = _descriptor.FileDescriptor(
   syntax='proto3',
   serialized_options=None,
   create_key=_descriptor._internal_create_key,
-  serialized_pb=b'\n\trpc.proto\x12\x0c\x65tcdserverpb\x1a\x08kv.proto\"\\\n\x0eResponseHeader\x12\x12\n\ncluster_id\x18\x01 \x01(\x04\x12\x11\n\tmember_id\x18\x02 \x01(\x04\x12\x10\n\x08revision\x18\x03 \x01(\x03\x12\x11\n\traft_term\x18\x04 \x01(\x04\"\xe4\x03\n\x0cRangeRequest\x12\x0b\n\x03key\x18\x01 \x01(\x0c\x12\x11\n\trange_end\x18\x02 \x01(\x0c\x12\r\n\x05limit\x18\x03 \x01(\x03\x12\x10\n\x08revision\x18\x04 \x01(\x03\x12\x38\n\nsort_order\x18\x05 \x01(\x0e\x32$.etcdserverpb.RangeRequest.SortOrder\x12:\n\x0bsort_target\x18\x06 \x01(\x0e\x32%.etcdserverpb.RangeRequest.SortTarget\x12\x14\n\x0cserializable\x18\x07 \x01(\x08\x12\x11\n\tkeys_only\x18\x08 \x01(\x08\x12\x12\n\ncount_only\x18\t \x01(\x08\x12\x18\n\x10min_mod_revision\x18\n \x01(\x03\x12\x18\n\x10max_mod_revision\x18\x0b \x01(\x03\x12\x1b\n\x13min_create_revision\x18\x0c \x01(\x03\x12\x1b\n\x13max_create_revision\x18\r \x01(\x03\".\n\tSortOrder\x12\x08\n\x04NONE\x10\x00\x12\n\n\x06\x41SCEND\x10\x01\x12\x0b\n\x07\x44\x45SCEND\x10\x02\"B\n\nSortTarget\x12\x07\n\x03KEY\x10\x00\x12\x0b\n\x07VERSION\x10\x01\x12\n\n\x06\x43REATE\x10\x02\x12\x07\n\x03MOD\x10\x03\x12\t\n\x05VALUE\x10\x04\"y\n\rRangeResponse\x12,\n\x06header\x18\x01 \x01(\x0b\x32\x1c.etcdserverpb.ResponseHeader\x12\x1d\n\x03kvs\x18\x02 \x03(\x0b\x32\x10.mvccpb.KeyValue\x12\x0c\n\x04more\x18\x03 \x01(\x08\x12\r\n\x05\x63ount\x18\x04 \x01(\x03\"t\n\nPutRequest\x12\x0b\n\x03key\x18\x01 \x01(\x0c\x12\r\n\x05value\x18\x02 \x01(\x0c\x12\r\n\x05lease\x18\x03 \x01(\x03\x12\x0f\n\x07prev_kv\x18\x04 \x01(\x08\x12\x14\n\x0cignore_value\x18\x05 \x01(\x08\x12\x14\n\x0cignore_lease\x18\x06 \x01(\x08\"^\n\x0bPutResponse\x12,\n\x06header\x18\x01 \x01(\x0b\x32\x1c.etcdserverpb.ResponseHeader\x12!\n\x07prev_kv\x18\x02 \x01(\x0b\x32\x10.mvccpb.KeyValue\"E\n\x12\x44\x65leteRangeRequest\x12\x0b\n\x03key\x18\x01 \x01(\x0c\x12\x11\n\trange_end\x18\x02 \x01(\x0c\x12\x0f\n\x07prev_kv\x18\x03 \x01(\x08\"x\n\x13\x44\x65leteRangeResponse\x12,\n\x06header\x18\x01 \x01(\x0b\x32\x1c.etcdserverpb.ResponseHeader\x12\x0f\n\x07\x64\x65leted\x18\x02 \x01(\x03\x12\"\n\x08prev_kvs\x18\x03 \x03(\x0b\x32\x10.mvccpb.KeyValue2\xdc\x01\n\x02KV\x12\x42\n\x05Range\x12\x1a.etcdserverpb.RangeRequest\x1a\x1b.etcdserverpb.RangeResponse\"\x00\x12<\n\x03Put\x12\x18.etcdserverpb.PutRequest\x1a\x19.etcdserverpb.PutResponse\"\x00\x12T\n\x0b\x44\x65leteRange\x12 .etcdserverpb.DeleteRangeRequest\x1a!.etcdserverpb.DeleteRangeResponse\"\x00\x62\x06proto3'
+  serialized_pb=b'\n\trpc.proto\x12\x0c\x65tcdserverpb\x1a\x08kv.proto\"\\\n\x0eResponseHeader\x12\x12\n\ncluster_id\x18\x01 \x01(\x04\x12\x11\n\tmember_id\x18\x02 \x01(\x04\x12\x10\n\x08revision\x18\x03 \x01(\x03\x12\x11\n\traft_term\x18\x04 \x01(\x04\"\xe4\x03\n\x0cRangeRequest\x12\x0b\n\x03key\x18\x01 \x01(\x0c\x12\x11\n\trange_end\x18\x02 \x01(\x0c\x12\r\n\x05limit\x18\x03 \x01(\x03\x12\x10\n\x08revision\x18\x04 \x01(\x03\x12\x38\n\nsort_order\x18\x05 \x01(\x0e\x32$.etcdserverpb.RangeRequest.SortOrder\x12:\n\x0bsort_target\x18\x06 \x01(\x0e\x32%.etcdserverpb.RangeRequest.SortTarget\x12\x14\n\x0cserializable\x18\x07 \x01(\x08\x12\x11\n\tkeys_only\x18\x08 \x01(\x08\x12\x12\n\ncount_only\x18\t \x01(\x08\x12\x18\n\x10min_mod_revision\x18\n \x01(\x03\x12\x18\n\x10max_mod_revision\x18\x0b \x01(\x03\x12\x1b\n\x13min_create_revision\x18\x0c \x01(\x03\x12\x1b\n\x13max_create_revision\x18\r \x01(\x03\".\n\tSortOrder\x12\x08\n\x04NONE\x10\x00\x12\n\n\x06\x41SCEND\x10\x01\x12\x0b\n\x07\x44\x45SCEND\x10\x02\"B\n\nSortTarget\x12\x07\n\x03KEY\x10\x00\x12\x0b\n\x07VERSION\x10\x01\x12\n\n\x06\x43REATE\x10\x02\x12\x07\n\x03MOD\x10\x03\x12\t\n\x05VALUE\x10\x04\"y\n\rRangeResponse\x12,\n\x06header\x18\x01 \x01(\x0b\x32\x1c.etcdserverpb.ResponseHeader\x12\x1d\n\x03kvs\x18\x02 \x03(\x0b\x32\x10.mvccpb.KeyValue\x12\x0c\n\x04more\x18\x03 \x01(\x08\x12\r\n\x05\x63ount\x18\x04 \x01(\x03\"t\n\nPutRequest\x12\x0b\n\x03key\x18\x01 \x01(\x0c\x12\r\n\x05value\x18\x02 \x01(\x0c\x12\r\n\x05lease\x18\x03 \x01(\x03\x12\x0f\n\x07prev_kv\x18\x04 \x01(\x08\x12\x14\n\x0cignore_value\x18\x05 \x01(\x08\x12\x14\n\x0cignore_lease\x18\x06 \x01(\x08\"^\n\x0bPutResponse\x12,\n\x06header\x18\x01 \x01(\x0b\x32\x1c.etcdserverpb.ResponseHeader\x12!\n\x07prev_kv\x18\x02 \x01(\x0b\x32\x10.mvccpb.KeyValue\"E\n\x12\x44\x65leteRangeRequest\x12\x0b\n\x03key\x18\x01 \x01(\x0c\x12\x11\n\trange_end\x18\x02 \x01(\x0c\x12\x0f\n\x07prev_kv\x18\x03 \x01(\x08\"x\n\x13\x44\x65leteRangeResponse\x12,\n\x06header\x18\x01 \x01(\x0b\x32\x1c.etcdserverpb.ResponseHeader\x12\x0f\n\x07\x64\x65leted\x18\x02 \x01(\x03\x12\"\n\x08prev_kvs\x18\x03 \x03(\x0b\x32\x10.mvccpb.KeyValue\"\xef\x01\n\tRequestOp\x12\x33\n\rrequest_range\x18\x01 \x01(\x0b\x32\x1a.etcdserverpb.RangeRequestH\x00\x12/\n\x0brequest_put\x18\x02 \x01(\x0b\x32\x18.etcdserverpb.PutRequestH\x00\x12@\n\x14request_delete_range\x18\x03 \x01(\x0b\x32 .etcdserverpb.DeleteRangeRequestH\x00\x12/\n\x0brequest_txn\x18\x04 \x01(\x0b\x32\x18.etcdserverpb.TxnRequestH\x00\x42\t\n\x07request\"\xf9\x01\n\nResponseOp\x12\x35\n\x0eresponse_range\x18\x01 \x01(\x0b\x32\x1b.etcdserverpb.RangeResponseH\x00\x12\x31\n\x0cresponse_put\x18\x02 \x01(\x0b\x32\x19.etcdserverpb.PutResponseH\x00\x12\x42\n\x15response_delete_range\x18\x03 \x01(\x0b\x32!.etcdserverpb.DeleteRangeResponseH\x00\x12\x31\n\x0cresponse_txn\x18\x04 \x01(\x0b\x32\x19.etcdserverpb.TxnResponseH\x00\x42\n\n\x08response\"\x96\x03\n\x07\x43ompare\x12\x33\n\x06result\x18\x01 \x01(\x0e\x32#.etcdserverpb.Compare.CompareResult\x12\x33\n\x06target\x18\x02 \x01(\x0e\x32#.etcdserverpb.Compare.CompareTarget\x12\x0b\n\x03key\x18\x03 \x01(\x0c\x12\x11\n\x07version\x18\x04 \x01(\x03H\x00\x12\x19\n\x0f\x63reate_revision\x18\x05 \x01(\x03H\x00\x12\x16\n\x0cmod_revision\x18\x06 \x01(\x03H\x00\x12\x0f\n\x05value\x18\x07 \x01(\x0cH\x00\x12\x0f\n\x05lease\x18\x08 \x01(\x03H\x00\x12\x11\n\trange_end\x18@ \x01(\x0c\"@\n\rCompareResult\x12\t\n\x05\x45QUAL\x10\x00\x12\x0b\n\x07GREATER\x10\x01\x12\x08\n\x04LESS\x10\x02\x12\r\n\tNOT_EQUAL\x10\x03\"G\n\rCompareTarget\x12\x0b\n\x07VERSION\x10\x00\x12\n\n\x06\x43REATE\x10\x01\x12\x07\n\x03MOD\x10\x02\x12\t\n\x05VALUE\x10\x03\x12\t\n\x05LEASE\x10\x04\x42\x0e\n\x0ctarget_union\"\x88\x01\n\nTxnRequest\x12&\n\x07\x63ompare\x18\x01 \x03(\x0b\x32\x15.etcdserverpb.Compare\x12(\n\x07success\x18\x02 \x03(\x0b\x32\x17.etcdserverpb.RequestOp\x12(\n\x07\x66\x61ilure\x18\x03 \x03(\x0b\x32\x17.etcdserverpb.RequestOp\"{\n\x0bTxnResponse\x12,\n\x06header\x18\x01 \x01(\x0b\x32\x1c.etcdserverpb.ResponseHeader\x12\x11\n\tsucceeded\x18\x02 \x01(\x08\x12+\n\tresponses\x18\x03 \x03(\x0b\x32\x18.etcdserverpb.ResponseOp\"\xd7\x01\n\x0cWatchRequest\x12:\n\x0e\x63reate_request\x18\x01 \x01(\x0b\x32 .etcdserverpb.WatchCreateRequestH\x00\x12:\n\x0e\x63\x61ncel_request\x18\x02 \x01(\x0b\x32 .etcdserverpb.WatchCancelRequestH\x00\x12>\n\x10progress_request\x18\x03 \x01(\x0b\x32\".etcdserverpb.WatchProgressRequestH\x00\x42\x0f\n\rrequest_union\"\xff\x01\n\x12WatchCreateRequest\x12\x0b\n\x03key\x18\x01 \x01(\x0c\x12\x11\n\trange_end\x18\x02 \x01(\x0c\x12\x16\n\x0estart_revision\x18\x03 \x01(\x03\x12\x17\n\x0fprogress_notify\x18\x04 \x01(\x08\x12<\n\x07\x66ilters\x18\x05 \x03(\x0e\x32+.etcdserverpb.WatchCreateRequest.FilterType\x12\x0f\n\x07prev_kv\x18\x06 \x01(\x08\x12\x10\n\x08watch_id\x18\x07 \x01(\x03\x12\x10\n\x08\x66ragment\x18\x08 \x01(\x08\"%\n\nFilterType\x12\t\n\x05NOPUT\x10\x00\x12\x0c\n\x08NODELETE\x10\x01\"&\n\x12WatchCancelRequest\x12\x10\n\x08watch_id\x18\x01 \x01(\x03\"\x16\n\x14WatchProgressRequest\"\xd4\x01\n\rWatchResponse\x12,\n\x06header\x18\x01 \x01(\x0b\x32\x1c.etcdserverpb.ResponseHeader\x12\x10\n\x08watch_id\x18\x02 \x01(\x03\x12\x0f\n\x07\x63reated\x18\x03 \x01(\x08\x12\x10\n\x08\x63\x61nceled\x18\x04 \x01(\x08\x12\x18\n\x10\x63ompact_revision\x18\x05 \x01(\x03\x12\x15\n\rcancel_reason\x18\x06 \x01(\t\x12\x10\n\x08\x66ragment\x18\x07 \x01(\x08\x12\x1d\n\x06\x65vents\x18\x0b \x03(\x0b\x32\r.mvccpb.Event\",\n\x11LeaseGrantRequest\x12\x0b\n\x03TTL\x18\x01 \x01(\x03\x12\n\n\x02ID\x18\x02 \x01(\x03\"j\n\x12LeaseGrantResponse\x12,\n\x06header\x18\x01 \x01(\x0b\x32\x1c.etcdserverpb.ResponseHeader\x12\n\n\x02ID\x18\x02 \x01(\x03\x12\x0b\n\x03TTL\x18\x03 \x01(\x03\x12\r\n\x05\x65rror\x18\x04 \x01(\t\" \n\x12LeaseRevokeRequest\x12\n\n\x02ID\x18\x01 \x01(\x03\"C\n\x13LeaseRevokeResponse\x12,\n\x06header\x18\x01 \x01(\x0b\x32\x1c.etcdserverpb.ResponseHeader\"#\n\x15LeaseKeepAliveRequest\x12\n\n\x02ID\x18\x01 \x01(\x03\"_\n\x16LeaseKeepAliveResponse\x12,\n\x06header\x18\x01 \x01(\x0b\x32\x1c.etcdserverpb.ResponseHeader\x12\n\n\x02ID\x18\x02 \x01(\x03\x12\x0b\n\x03TTL\x18\x03 \x01(\x03\"7\n\x11\x43ompactionRequest\x12\x10\n\x08revision\x18\x01 \x01(\x03\x12\x10\n\x08physical\x18\x02 \x01(\x08\"B\n\x12\x43ompactionResponse\x12,\n\x06header\x18\x01 \x01(\x0b\x32\x1c.etcdserverpb.ResponseHeader\"[\n\x06Member\x12\n\n\x02ID\x18\x01 \x01(\x04\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x10\n\x08peerURLs\x18\x03 \x03(\t\x12\x12\n\nclientURLs\x18\x04 \x03(\t\x12\x11\n\tisLearner\x18\x05 \x01(\x08\")\n\x11MemberListRequest\x12\x14\n\x0clinearizable\x18\x01 \x01(\x08\"i\n\x12MemberListResponse\x12,\n\x06header\x18\x01 \x01(\x0b\x32\x1c.etcdserverpb.ResponseHeader\x12%\n\x07members\x18\x02 \x03(\x0b\x32\x14.etcdserverpb.Member\"\x13\n\x11\x44\x65\x66ragmentRequest\"B\n\x12\x44\x65\x66ragmentResponse\x12,\n\x06header\x18\x01 \x01(\x0b\x32\x1c.etcdserverpb.ResponseHeader\"!\n\rHashKVRequest\x12\x10\n\x08revision\x18\x01 \x01(\x03\"f\n\x0eHashKVResponse\x12,\n\x06header\x18\x01 \x01(\x0b\x32\x1c.etcdserverpb.ResponseHeader\x12\x0c\n\x04hash\x18\x02 \x01(\r\x12\x18\n\x10\x63ompact_revision\x18\x03 \x01(\x03\"\x0f\n\rStatusRequest\"\xe6\x01\n\x0eStatusResponse\x12,\n\x06header\x18\x01 \x01(\x0b\x32\x1c.etcdserverpb.ResponseHeader\x12\x0f\n\x07version\x18\x02 \x01(\t\x12\x0e\n\x06\x64\x62Size\x18\x03 \x01(\x03\x12\x0e\n\x06leader\x18\x04 \x01(\x04\x12\x11\n\traftIndex\x18\x05 \x01(\x04\x12\x10\n\x08raftTerm\x18\x06 \x01(\x04\x12\x18\n\x10raftAppliedIndex\x18\x07 \x01(\x04\x12\x0e\n\x06\x65rrors\x18\x08 \x03(\t\x12\x13\n\x0b\x64\x62SizeInUse\x18\t \x01(\x03\x12\x11\n\tisLearner\x18\n \x01(\x08\x32\xea\x02\n\x02KV\x12\x42\n\x05Range\x12\x1a.etcdserverpb.RangeRequest\x1a\x1b.etcdserverpb.RangeResponse\"\x00\x12<\n\x03Put\x12\x18.etcdserverpb.PutRequest\x1a\x19.etcdserverpb.PutResponse\"\x00\x12T\n\x0b\x44\x65leteRange\x12 .etcdserverpb.DeleteRangeRequest\x1a!.etcdserverpb.DeleteRangeResponse\"\x00\x12<\n\x03Txn\x12\x18.etcdserverpb.TxnRequest\x1a\x19.etcdserverpb.TxnResponse\"\x00\x12N\n\x07\x43ompact\x12\x1f.etcdserverpb.CompactionRequest\x1a .etcdserverpb.CompactionResponse\"\x00\x32O\n\x05Watch\x12\x46\n\x05Watch\x12\x1a.etcdserverpb.WatchRequest\x1a\x1b.etcdserverpb.WatchResponse\"\x00(\x01\x30\x01\x32\x93\x02\n\x05Lease\x12Q\n\nLeaseGrant\x12\x1f.etcdserverpb.LeaseGrantRequest\x1a .etcdserverpb.LeaseGrantResponse\"\x00\x12T\n\x0bLeaseRevoke\x12 .etcdserverpb.LeaseRevokeRequest\x1a!.etcdserverpb.LeaseRevokeResponse\"\x00\x12\x61\n\x0eLeaseKeepAlive\x12#.etcdserverpb.LeaseKeepAliveRequest\x1a$.etcdserverpb.LeaseKeepAliveResponse\"\x00(\x01\x30\x01\x32\\\n\x07\x43luster\x12Q\n\nMemberList\x12\x1f.etcdserverpb.MemberListRequest\x1a .etcdserverpb.MemberListResponse\"\x00\x32\xee\x01\n\x0bMaintenance\x12\x45\n\x06Status\x12\x1b.etcdserverpb.StatusRequest\x1a\x1c.etcdserverpb.StatusResponse\"\x00\x12Q\n\nDefragment\x12\x1f.etcdserverpb.DefragmentRequest\x1a .etcdserverpb.DefragmentResponse\"\x00\x12\x45\n\x06HashKV\x12\x1b.etcdserverpb.HashKVRequest\x1a\x1c.etcdserverpb.HashKVResponse\"\x00\x62\x06proto3'
   ,
   dependencies=[kv__pb2.DESCRIPTOR,])
 
@@ -96,6 +96,106 @@ _RANGEREQUEST_SORTTARGET = _descriptor.EnumDescriptor(
 )
 _sym_db.RegisterEnumDescriptor(_RANGEREQUEST_SORTTARGET)
 
+_COMPARE_COMPARERESULT = _descriptor.EnumDescriptor(
+  name='CompareResult',
+  full_name='etcdserverpb.Compare.CompareResult',
+  filename=None,
+  file=DESCRIPTOR,
+  create_key=_descriptor._internal_create_key,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='EQUAL', index=0, number=0,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='GREATER', index=1, number=1,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='LESS', index=2, number=2,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='NOT_EQUAL', index=3, number=3,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=1896,
+  serialized_end=1960,
+)
+_sym_db.RegisterEnumDescriptor(_COMPARE_COMPARERESULT)
+
+_COMPARE_COMPARETARGET = _descriptor.EnumDescriptor(
+  name='CompareTarget',
+  full_name='etcdserverpb.Compare.CompareTarget',
+  filename=None,
+  file=DESCRIPTOR,
+  create_key=_descriptor._internal_create_key,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='VERSION', index=0, number=0,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='CREATE', index=1, number=1,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='MOD', index=2, number=2,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='VALUE', index=3, number=3,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='LEASE', index=4, number=4,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=1962,
+  serialized_end=2033,
+)
+_sym_db.RegisterEnumDescriptor(_COMPARE_COMPARETARGET)
+
+_WATCHCREATEREQUEST_FILTERTYPE = _descriptor.EnumDescriptor(
+  name='FilterType',
+  full_name='etcdserverpb.WatchCreateRequest.FilterType',
+  filename=None,
+  file=DESCRIPTOR,
+  create_key=_descriptor._internal_create_key,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='NOPUT', index=0, number=0,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='NODELETE', index=1, number=1,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=2752,
+  serialized_end=2789,
+)
+_sym_db.RegisterEnumDescriptor(_WATCHCREATEREQUEST_FILTERTYPE)
+
 
 _RESPONSEHEADER = _descriptor.Descriptor(
   name='ResponseHeader',
@@ -518,119 +618,1845 @@ _DELETERANGERESPONSE = _descriptor.Descriptor(
   serialized_end=1146,
 )
 
-_RANGEREQUEST.fields_by_name['sort_order'].enum_type = _RANGEREQUEST_SORTORDER
-_RANGEREQUEST.fields_by_name['sort_target'].enum_type = _RANGEREQUEST_SORTTARGET
-_RANGEREQUEST_SORTORDER.containing_type = _RANGEREQUEST
-_RANGEREQUEST_SORTTARGET.containing_type = _RANGEREQUEST
-_RANGERESPONSE.fields_by_name['header'].message_type = _RESPONSEHEADER
-_RANGERESPONSE.fields_by_name['kvs'].message_type = kv__pb2._KEYVALUE
-_PUTRESPONSE.fields_by_name['header'].message_type = _RESPONSEHEADER
-_PUTRESPONSE.fields_by_name['prev_kv'].message_type = kv__pb2._KEYVALUE
-_DELETERANGERESPONSE.fields_by_name['header'].message_type = _RESPONSEHEADER
-_DELETERANGERESPONSE.fields_by_name['prev_kvs'].message_type = kv__pb2._KEYVALUE
-DESCRIPTOR.message_types_by_name['ResponseHeader'] = _RESPONSEHEADER
-DESCRIPTOR.message_types_by_name['RangeRequest'] = _RANGEREQUEST
-DESCRIPTOR.message_types_by_name['RangeResponse'] = _RANGERESPONSE
-DESCRIPTOR.message_types_by_name['PutRequest'] = _PUTREQUEST
-DESCRIPTOR.message_types_by_name['PutResponse'] = _PUTRESPONSE
-DESCRIPTOR.message_types_by_name['DeleteRangeRequest'] = _DELETERANGEREQUEST
-DESCRIPTOR.message_types_by_name['DeleteRangeResponse'] = _DELETERANGERESPONSE
-_sym_db.RegisterFileDescriptor(DESCRIPTOR)
-
-ResponseHeader = _reflection.GeneratedProtocolMessageType('ResponseHeader', (_message.Message,), {
-  'DESCRIPTOR' : _RESPONSEHEADER,
-  '__module__' : 'rpc_pb2'
-  # @@protoc_insertion_point(class_scope:etcdserverpb.ResponseHeader)
-  })
-_sym_db.RegisterMessage(ResponseHeader)
-
-RangeRequest = _reflection.GeneratedProtocolMessageType('RangeRequest', (_message.Message,), {
-  'DESCRIPTOR' : _RANGEREQUEST,
-  '__module__' : 'rpc_pb2'
-  # @@protoc_insertion_point(class_scope:etcdserverpb.RangeRequest)
-  })
-_sym_db.RegisterMessage(RangeRequest)
-
-RangeResponse = _reflection.GeneratedProtocolMessageType('RangeResponse', (_message.Message,), {
-  'DESCRIPTOR' : _RANGERESPONSE,
-  '__module__' : 'rpc_pb2'
-  # @@protoc_insertion_point(class_scope:etcdserverpb.RangeResponse)
-  })
-_sym_db.RegisterMessage(RangeResponse)
-
-PutRequest = _reflection.GeneratedProtocolMessageType('PutRequest', (_message.Message,), {
-  'DESCRIPTOR' : _PUTREQUEST,
-  '__module__' : 'rpc_pb2'
-  # @@protoc_insertion_point(class_scope:etcdserverpb.PutRequest)
-  })
-_sym_db.RegisterMessage(PutRequest)
-
-PutResponse = _reflection.GeneratedProtocolMessageType('PutResponse', (_message.Message,), {
-  'DESCRIPTOR' : _PUTRESPONSE,
-  '__module__' : 'rpc_pb2'
-  # @@protoc_insertion_point(class_scope:etcdserverpb.PutResponse)
-  })
-_sym_db.RegisterMessage(PutResponse)
 
-DeleteRangeRequest = _reflection.GeneratedProtocolMessageType('DeleteRangeRequest', (_message.Message,), {
-  'DESCRIPTOR' : _DELETERANGEREQUEST,
-  '__module__' : 'rpc_pb2'
-  # @@protoc_insertion_point(class_scope:etcdserverpb.DeleteRangeRequest)
-  })
-_sym_db.RegisterMessage(DeleteRangeRequest)
+_REQUESTOP = _descriptor.Descriptor(
+  name='RequestOp',
+  full_name='etcdserverpb.RequestOp',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='request_range', full_name='etcdserverpb.RequestOp.request_range', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='request_put', full_name='etcdserverpb.RequestOp.request_put', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='request_delete_range', full_name='etcdserverpb.RequestOp.request_delete_range', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='request_txn', full_name='etcdserverpb.RequestOp.request_txn', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='request', full_name='etcdserverpb.RequestOp.request',
+      index=0, containing_type=None,
+      create_key=_descriptor._internal_create_key,
+    fields=[]),
+  ],
+  serialized_start=1149,
+  serialized_end=1388,
+)
 
-DeleteRangeResponse = _reflection.GeneratedProtocolMessageType('DeleteRangeResponse', (_message.Message,), {
-  'DESCRIPTOR' : _DELETERANGERESPONSE,
-  '__module__' : 'rpc_pb2'
-  # @@protoc_insertion_point(class_scope:etcdserverpb.DeleteRangeResponse)
-  })
-_sym_db.RegisterMessage(DeleteRangeResponse)
 
+_RESPONSEOP = _descriptor.Descriptor(
+  name='ResponseOp',
+  full_name='etcdserverpb.ResponseOp',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='response_range', full_name='etcdserverpb.ResponseOp.response_range', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='response_put', full_name='etcdserverpb.ResponseOp.response_put', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='response_delete_range', full_name='etcdserverpb.ResponseOp.response_delete_range', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='response_txn', full_name='etcdserverpb.ResponseOp.response_txn', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='response', full_name='etcdserverpb.ResponseOp.response',
+      index=0, containing_type=None,
+      create_key=_descriptor._internal_create_key,
+    fields=[]),
+  ],
+  serialized_start=1391,
+  serialized_end=1640,
+)
 
 
-_KV = _descriptor.ServiceDescriptor(
-  name='KV',
-  full_name='etcdserverpb.KV',
+_COMPARE = _descriptor.Descriptor(
+  name='Compare',
+  full_name='etcdserverpb.Compare',
+  filename=None,
   file=DESCRIPTOR,
-  index=0,
-  serialized_options=None,
+  containing_type=None,
   create_key=_descriptor._internal_create_key,
-  serialized_start=1149,
-  serialized_end=1369,
-  methods=[
-  _descriptor.MethodDescriptor(
-    name='Range',
-    full_name='etcdserverpb.KV.Range',
-    index=0,
-    containing_service=None,
-    input_type=_RANGEREQUEST,
-    output_type=_RANGERESPONSE,
-    serialized_options=None,
-    create_key=_descriptor._internal_create_key,
-  ),
-  _descriptor.MethodDescriptor(
-    name='Put',
-    full_name='etcdserverpb.KV.Put',
-    index=1,
-    containing_service=None,
-    input_type=_PUTREQUEST,
-    output_type=_PUTRESPONSE,
-    serialized_options=None,
-    create_key=_descriptor._internal_create_key,
-  ),
-  _descriptor.MethodDescriptor(
-    name='DeleteRange',
-    full_name='etcdserverpb.KV.DeleteRange',
-    index=2,
-    containing_service=None,
-    input_type=_DELETERANGEREQUEST,
-    output_type=_DELETERANGERESPONSE,
-    serialized_options=None,
-    create_key=_descriptor._internal_create_key,
-  ),
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='result', full_name='etcdserverpb.Compare.result', index=0,
+      number=1, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='target', full_name='etcdserverpb.Compare.target', index=1,
+      number=2, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='key', full_name='etcdserverpb.Compare.key', index=2,
+      number=3, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='version', full_name='etcdserverpb.Compare.version', index=3,
+      number=4, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='create_revision', full_name='etcdserverpb.Compare.create_revision', index=4,
+      number=5, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='mod_revision', full_name='etcdserverpb.Compare.mod_revision', index=5,
+      number=6, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='etcdserverpb.Compare.value', index=6,
+      number=7, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='lease', full_name='etcdserverpb.Compare.lease', index=7,
+      number=8, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='range_end', full_name='etcdserverpb.Compare.range_end', index=8,
+      number=64, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _COMPARE_COMPARERESULT,
+    _COMPARE_COMPARETARGET,
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='target_union', full_name='etcdserverpb.Compare.target_union',
+      index=0, containing_type=None,
+      create_key=_descriptor._internal_create_key,
+    fields=[]),
+  ],
+  serialized_start=1643,
+  serialized_end=2049,
+)
+
+
+_TXNREQUEST = _descriptor.Descriptor(
+  name='TxnRequest',
+  full_name='etcdserverpb.TxnRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='compare', full_name='etcdserverpb.TxnRequest.compare', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='success', full_name='etcdserverpb.TxnRequest.success', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='failure', full_name='etcdserverpb.TxnRequest.failure', index=2,
+      number=3, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2052,
+  serialized_end=2188,
+)
+
+
+_TXNRESPONSE = _descriptor.Descriptor(
+  name='TxnResponse',
+  full_name='etcdserverpb.TxnResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='header', full_name='etcdserverpb.TxnResponse.header', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='succeeded', full_name='etcdserverpb.TxnResponse.succeeded', index=1,
+      number=2, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='responses', full_name='etcdserverpb.TxnResponse.responses', index=2,
+      number=3, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2190,
+  serialized_end=2313,
+)
+
+
+_WATCHREQUEST = _descriptor.Descriptor(
+  name='WatchRequest',
+  full_name='etcdserverpb.WatchRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='create_request', full_name='etcdserverpb.WatchRequest.create_request', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='cancel_request', full_name='etcdserverpb.WatchRequest.cancel_request', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='progress_request', full_name='etcdserverpb.WatchRequest.progress_request', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='request_union', full_name='etcdserverpb.WatchRequest.request_union',
+      index=0, containing_type=None,
+      create_key=_descriptor._internal_create_key,
+    fields=[]),
+  ],
+  serialized_start=2316,
+  serialized_end=2531,
+)
+
+
+_WATCHCREATEREQUEST = _descriptor.Descriptor(
+  name='WatchCreateRequest',
+  full_name='etcdserverpb.WatchCreateRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='etcdserverpb.WatchCreateRequest.key', index=0,
+      number=1, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='range_end', full_name='etcdserverpb.WatchCreateRequest.range_end', index=1,
+      number=2, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='start_revision', full_name='etcdserverpb.WatchCreateRequest.start_revision', index=2,
+      number=3, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='progress_notify', full_name='etcdserverpb.WatchCreateRequest.progress_notify', index=3,
+      number=4, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='filters', full_name='etcdserverpb.WatchCreateRequest.filters', index=4,
+      number=5, type=14, cpp_type=8, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='prev_kv', full_name='etcdserverpb.WatchCreateRequest.prev_kv', index=5,
+      number=6, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='watch_id', full_name='etcdserverpb.WatchCreateRequest.watch_id', index=6,
+      number=7, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='fragment', full_name='etcdserverpb.WatchCreateRequest.fragment', index=7,
+      number=8, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _WATCHCREATEREQUEST_FILTERTYPE,
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2534,
+  serialized_end=2789,
+)
+
+
+_WATCHCANCELREQUEST = _descriptor.Descriptor(
+  name='WatchCancelRequest',
+  full_name='etcdserverpb.WatchCancelRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='watch_id', full_name='etcdserverpb.WatchCancelRequest.watch_id', index=0,
+      number=1, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2791,
+  serialized_end=2829,
+)
+
+
+_WATCHPROGRESSREQUEST = _descriptor.Descriptor(
+  name='WatchProgressRequest',
+  full_name='etcdserverpb.WatchProgressRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2831,
+  serialized_end=2853,
+)
+
+
+_WATCHRESPONSE = _descriptor.Descriptor(
+  name='WatchResponse',
+  full_name='etcdserverpb.WatchResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='header', full_name='etcdserverpb.WatchResponse.header', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='watch_id', full_name='etcdserverpb.WatchResponse.watch_id', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='created', full_name='etcdserverpb.WatchResponse.created', index=2,
+      number=3, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='canceled', full_name='etcdserverpb.WatchResponse.canceled', index=3,
+      number=4, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='compact_revision', full_name='etcdserverpb.WatchResponse.compact_revision', index=4,
+      number=5, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='cancel_reason', full_name='etcdserverpb.WatchResponse.cancel_reason', index=5,
+      number=6, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='fragment', full_name='etcdserverpb.WatchResponse.fragment', index=6,
+      number=7, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='events', full_name='etcdserverpb.WatchResponse.events', index=7,
+      number=11, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2856,
+  serialized_end=3068,
+)
+
+
+_LEASEGRANTREQUEST = _descriptor.Descriptor(
+  name='LeaseGrantRequest',
+  full_name='etcdserverpb.LeaseGrantRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='TTL', full_name='etcdserverpb.LeaseGrantRequest.TTL', index=0,
+      number=1, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='ID', full_name='etcdserverpb.LeaseGrantRequest.ID', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3070,
+  serialized_end=3114,
+)
+
+
+_LEASEGRANTRESPONSE = _descriptor.Descriptor(
+  name='LeaseGrantResponse',
+  full_name='etcdserverpb.LeaseGrantResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='header', full_name='etcdserverpb.LeaseGrantResponse.header', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='ID', full_name='etcdserverpb.LeaseGrantResponse.ID', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='TTL', full_name='etcdserverpb.LeaseGrantResponse.TTL', index=2,
+      number=3, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='error', full_name='etcdserverpb.LeaseGrantResponse.error', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3116,
+  serialized_end=3222,
+)
+
+
+_LEASEREVOKEREQUEST = _descriptor.Descriptor(
+  name='LeaseRevokeRequest',
+  full_name='etcdserverpb.LeaseRevokeRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='ID', full_name='etcdserverpb.LeaseRevokeRequest.ID', index=0,
+      number=1, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3224,
+  serialized_end=3256,
+)
+
+
+_LEASEREVOKERESPONSE = _descriptor.Descriptor(
+  name='LeaseRevokeResponse',
+  full_name='etcdserverpb.LeaseRevokeResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='header', full_name='etcdserverpb.LeaseRevokeResponse.header', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3258,
+  serialized_end=3325,
+)
+
+
+_LEASEKEEPALIVEREQUEST = _descriptor.Descriptor(
+  name='LeaseKeepAliveRequest',
+  full_name='etcdserverpb.LeaseKeepAliveRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='ID', full_name='etcdserverpb.LeaseKeepAliveRequest.ID', index=0,
+      number=1, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3327,
+  serialized_end=3362,
+)
+
+
+_LEASEKEEPALIVERESPONSE = _descriptor.Descriptor(
+  name='LeaseKeepAliveResponse',
+  full_name='etcdserverpb.LeaseKeepAliveResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='header', full_name='etcdserverpb.LeaseKeepAliveResponse.header', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='ID', full_name='etcdserverpb.LeaseKeepAliveResponse.ID', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='TTL', full_name='etcdserverpb.LeaseKeepAliveResponse.TTL', index=2,
+      number=3, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3364,
+  serialized_end=3459,
+)
+
+
+_COMPACTIONREQUEST = _descriptor.Descriptor(
+  name='CompactionRequest',
+  full_name='etcdserverpb.CompactionRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='revision', full_name='etcdserverpb.CompactionRequest.revision', index=0,
+      number=1, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='physical', full_name='etcdserverpb.CompactionRequest.physical', index=1,
+      number=2, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3461,
+  serialized_end=3516,
+)
+
+
+_COMPACTIONRESPONSE = _descriptor.Descriptor(
+  name='CompactionResponse',
+  full_name='etcdserverpb.CompactionResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='header', full_name='etcdserverpb.CompactionResponse.header', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3518,
+  serialized_end=3584,
+)
+
+
+_MEMBER = _descriptor.Descriptor(
+  name='Member',
+  full_name='etcdserverpb.Member',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='ID', full_name='etcdserverpb.Member.ID', index=0,
+      number=1, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='name', full_name='etcdserverpb.Member.name', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='peerURLs', full_name='etcdserverpb.Member.peerURLs', index=2,
+      number=3, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='clientURLs', full_name='etcdserverpb.Member.clientURLs', index=3,
+      number=4, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='isLearner', full_name='etcdserverpb.Member.isLearner', index=4,
+      number=5, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3586,
+  serialized_end=3677,
+)
+
+
+_MEMBERLISTREQUEST = _descriptor.Descriptor(
+  name='MemberListRequest',
+  full_name='etcdserverpb.MemberListRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='linearizable', full_name='etcdserverpb.MemberListRequest.linearizable', index=0,
+      number=1, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3679,
+  serialized_end=3720,
+)
+
+
+_MEMBERLISTRESPONSE = _descriptor.Descriptor(
+  name='MemberListResponse',
+  full_name='etcdserverpb.MemberListResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='header', full_name='etcdserverpb.MemberListResponse.header', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='members', full_name='etcdserverpb.MemberListResponse.members', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3722,
+  serialized_end=3827,
+)
+
+
+_DEFRAGMENTREQUEST = _descriptor.Descriptor(
+  name='DefragmentRequest',
+  full_name='etcdserverpb.DefragmentRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3829,
+  serialized_end=3848,
+)
+
+
+_DEFRAGMENTRESPONSE = _descriptor.Descriptor(
+  name='DefragmentResponse',
+  full_name='etcdserverpb.DefragmentResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='header', full_name='etcdserverpb.DefragmentResponse.header', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3850,
+  serialized_end=3916,
+)
+
+
+_HASHKVREQUEST = _descriptor.Descriptor(
+  name='HashKVRequest',
+  full_name='etcdserverpb.HashKVRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='revision', full_name='etcdserverpb.HashKVRequest.revision', index=0,
+      number=1, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3918,
+  serialized_end=3951,
+)
+
+
+_HASHKVRESPONSE = _descriptor.Descriptor(
+  name='HashKVResponse',
+  full_name='etcdserverpb.HashKVResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='header', full_name='etcdserverpb.HashKVResponse.header', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='hash', full_name='etcdserverpb.HashKVResponse.hash', index=1,
+      number=2, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='compact_revision', full_name='etcdserverpb.HashKVResponse.compact_revision', index=2,
+      number=3, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3953,
+  serialized_end=4055,
+)
+
+
+_STATUSREQUEST = _descriptor.Descriptor(
+  name='StatusRequest',
+  full_name='etcdserverpb.StatusRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4057,
+  serialized_end=4072,
+)
+
+
+_STATUSRESPONSE = _descriptor.Descriptor(
+  name='StatusResponse',
+  full_name='etcdserverpb.StatusResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='header', full_name='etcdserverpb.StatusResponse.header', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='version', full_name='etcdserverpb.StatusResponse.version', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='dbSize', full_name='etcdserverpb.StatusResponse.dbSize', index=2,
+      number=3, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='leader', full_name='etcdserverpb.StatusResponse.leader', index=3,
+      number=4, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='raftIndex', full_name='etcdserverpb.StatusResponse.raftIndex', index=4,
+      number=5, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='raftTerm', full_name='etcdserverpb.StatusResponse.raftTerm', index=5,
+      number=6, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='raftAppliedIndex', full_name='etcdserverpb.StatusResponse.raftAppliedIndex', index=6,
+      number=7, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='errors', full_name='etcdserverpb.StatusResponse.errors', index=7,
+      number=8, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='dbSizeInUse', full_name='etcdserverpb.StatusResponse.dbSizeInUse', index=8,
+      number=9, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='isLearner', full_name='etcdserverpb.StatusResponse.isLearner', index=9,
+      number=10, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4075,
+  serialized_end=4305,
+)
+
+_RANGEREQUEST.fields_by_name['sort_order'].enum_type = _RANGEREQUEST_SORTORDER
+_RANGEREQUEST.fields_by_name['sort_target'].enum_type = _RANGEREQUEST_SORTTARGET
+_RANGEREQUEST_SORTORDER.containing_type = _RANGEREQUEST
+_RANGEREQUEST_SORTTARGET.containing_type = _RANGEREQUEST
+_RANGERESPONSE.fields_by_name['header'].message_type = _RESPONSEHEADER
+_RANGERESPONSE.fields_by_name['kvs'].message_type = kv__pb2._KEYVALUE
+_PUTRESPONSE.fields_by_name['header'].message_type = _RESPONSEHEADER
+_PUTRESPONSE.fields_by_name['prev_kv'].message_type = kv__pb2._KEYVALUE
+_DELETERANGERESPONSE.fields_by_name['header'].message_type = _RESPONSEHEADER
+_DELETERANGERESPONSE.fields_by_name['prev_kvs'].message_type = kv__pb2._KEYVALUE
+_REQUESTOP.fields_by_name['request_range'].message_type = _RANGEREQUEST
+_REQUESTOP.fields_by_name['request_put'].message_type = _PUTREQUEST
+_REQUESTOP.fields_by_name['request_delete_range'].message_type = _DELETERANGEREQUEST
+_REQUESTOP.fields_by_name['request_txn'].message_type = _TXNREQUEST
+_REQUESTOP.oneofs_by_name['request'].fields.append(
+  _REQUESTOP.fields_by_name['request_range'])
+_REQUESTOP.fields_by_name['request_range'].containing_oneof = _REQUESTOP.oneofs_by_name['request']
+_REQUESTOP.oneofs_by_name['request'].fields.append(
+  _REQUESTOP.fields_by_name['request_put'])
+_REQUESTOP.fields_by_name['request_put'].containing_oneof = _REQUESTOP.oneofs_by_name['request']
+_REQUESTOP.oneofs_by_name['request'].fields.append(
+  _REQUESTOP.fields_by_name['request_delete_range'])
+_REQUESTOP.fields_by_name['request_delete_range'].containing_oneof = _REQUESTOP.oneofs_by_name['request']
+_REQUESTOP.oneofs_by_name['request'].fields.append(
+  _REQUESTOP.fields_by_name['request_txn'])
+_REQUESTOP.fields_by_name['request_txn'].containing_oneof = _REQUESTOP.oneofs_by_name['request']
+_RESPONSEOP.fields_by_name['response_range'].message_type = _RANGERESPONSE
+_RESPONSEOP.fields_by_name['response_put'].message_type = _PUTRESPONSE
+_RESPONSEOP.fields_by_name['response_delete_range'].message_type = _DELETERANGERESPONSE
+_RESPONSEOP.fields_by_name['response_txn'].message_type = _TXNRESPONSE
+_RESPONSEOP.oneofs_by_name['response'].fields.append(
+  _RESPONSEOP.fields_by_name['response_range'])
+_RESPONSEOP.fields_by_name['response_range'].containing_oneof = _RESPONSEOP.oneofs_by_name['response']
+_RESPONSEOP.oneofs_by_name['response'].fields.append(
+  _RESPONSEOP.fields_by_name['response_put'])
+_RESPONSEOP.fields_by_name['response_put'].containing_oneof = _RESPONSEOP.oneofs_by_name['response']
+_RESPONSEOP.oneofs_by_name['response'].fields.append(
+  _RESPONSEOP.fields_by_name['response_delete_range'])
+_RESPONSEOP.fields_by_name['response_delete_range'].containing_oneof = _RESPONSEOP.oneofs_by_name['response']
+_RESPONSEOP.oneofs_by_name['response'].fields.append(
+  _RESPONSEOP.fields_by_name['response_txn'])
+_RESPONSEOP.fields_by_name['response_txn'].containing_oneof = _RESPONSEOP.oneofs_by_name['response']
+_COMPARE.fields_by_name['result'].enum_type = _COMPARE_COMPARERESULT
+_COMPARE.fields_by_name['target'].enum_type = _COMPARE_COMPARETARGET
+_COMPARE_COMPARERESULT.containing_type = _COMPARE
+_COMPARE_COMPARETARGET.containing_type = _COMPARE
+_COMPARE.oneofs_by_name['target_union'].fields.append(
+  _COMPARE.fields_by_name['version'])
+_COMPARE.fields_by_name['version'].containing_oneof = _COMPARE.oneofs_by_name['target_union']
+_COMPARE.oneofs_by_name['target_union'].fields.append(
+  _COMPARE.fields_by_name['create_revision'])
+_COMPARE.fields_by_name['create_revision'].containing_oneof = _COMPARE.oneofs_by_name['target_union']
+_COMPARE.oneofs_by_name['target_union'].fields.append(
+  _COMPARE.fields_by_name['mod_revision'])
+_COMPARE.fields_by_name['mod_revision'].containing_oneof = _COMPARE.oneofs_by_name['target_union']
+_COMPARE.oneofs_by_name['target_union'].fields.append(
+  _COMPARE.fields_by_name['value'])
+_COMPARE.fields_by_name['value'].containing_oneof = _COMPARE.oneofs_by_name['target_union']
+_COMPARE.oneofs_by_name['target_union'].fields.append(
+  _COMPARE.fields_by_name['lease'])
+_COMPARE.fields_by_name['lease'].containing_oneof = _COMPARE.oneofs_by_name['target_union']
+_TXNREQUEST.fields_by_name['compare'].message_type = _COMPARE
+_TXNREQUEST.fields_by_name['success'].message_type = _REQUESTOP
+_TXNREQUEST.fields_by_name['failure'].message_type = _REQUESTOP
+_TXNRESPONSE.fields_by_name['header'].message_type = _RESPONSEHEADER
+_TXNRESPONSE.fields_by_name['responses'].message_type = _RESPONSEOP
+_WATCHREQUEST.fields_by_name['create_request'].message_type = _WATCHCREATEREQUEST
+_WATCHREQUEST.fields_by_name['cancel_request'].message_type = _WATCHCANCELREQUEST
+_WATCHREQUEST.fields_by_name['progress_request'].message_type = _WATCHPROGRESSREQUEST
+_WATCHREQUEST.oneofs_by_name['request_union'].fields.append(
+  _WATCHREQUEST.fields_by_name['create_request'])
+_WATCHREQUEST.fields_by_name['create_request'].containing_oneof = _WATCHREQUEST.oneofs_by_name['request_union']
+_WATCHREQUEST.oneofs_by_name['request_union'].fields.append(
+  _WATCHREQUEST.fields_by_name['cancel_request'])
+_WATCHREQUEST.fields_by_name['cancel_request'].containing_oneof = _WATCHREQUEST.oneofs_by_name['request_union']
+_WATCHREQUEST.oneofs_by_name['request_union'].fields.append(
+  _WATCHREQUEST.fields_by_name['progress_request'])
+_WATCHREQUEST.fields_by_name['progress_request'].containing_oneof = _WATCHREQUEST.oneofs_by_name['request_union']
+_WATCHCREATEREQUEST.fields_by_name['filters'].enum_type = _WATCHCREATEREQUEST_FILTERTYPE
+_WATCHCREATEREQUEST_FILTERTYPE.containing_type = _WATCHCREATEREQUEST
+_WATCHRESPONSE.fields_by_name['header'].message_type = _RESPONSEHEADER
+_WATCHRESPONSE.fields_by_name['events'].message_type = kv__pb2._EVENT
+_LEASEGRANTRESPONSE.fields_by_name['header'].message_type = _RESPONSEHEADER
+_LEASEREVOKERESPONSE.fields_by_name['header'].message_type = _RESPONSEHEADER
+_LEASEKEEPALIVERESPONSE.fields_by_name['header'].message_type = _RESPONSEHEADER
+_COMPACTIONRESPONSE.fields_by_name['header'].message_type = _RESPONSEHEADER
+_MEMBERLISTRESPONSE.fields_by_name['header'].message_type = _RESPONSEHEADER
+_MEMBERLISTRESPONSE.fields_by_name['members'].message_type = _MEMBER
+_DEFRAGMENTRESPONSE.fields_by_name['header'].message_type = _RESPONSEHEADER
+_HASHKVRESPONSE.fields_by_name['header'].message_type = _RESPONSEHEADER
+_STATUSRESPONSE.fields_by_name['header'].message_type = _RESPONSEHEADER
+DESCRIPTOR.message_types_by_name['ResponseHeader'] = _RESPONSEHEADER
+DESCRIPTOR.message_types_by_name['RangeRequest'] = _RANGEREQUEST
+DESCRIPTOR.message_types_by_name['RangeResponse'] = _RANGERESPONSE
+DESCRIPTOR.message_types_by_name['PutRequest'] = _PUTREQUEST
+DESCRIPTOR.message_types_by_name['PutResponse'] = _PUTRESPONSE
+DESCRIPTOR.message_types_by_name['DeleteRangeRequest'] = _DELETERANGEREQUEST
+DESCRIPTOR.message_types_by_name['DeleteRangeResponse'] = _DELETERANGERESPONSE
+DESCRIPTOR.message_types_by_name['RequestOp'] = _REQUESTOP
+DESCRIPTOR.message_types_by_name['ResponseOp'] = _RESPONSEOP
+DESCRIPTOR.message_types_by_name['Compare'] = _COMPARE
+DESCRIPTOR.message_types_by_name['TxnRequest'] = _TXNREQUEST
+DESCRIPTOR.message_types_by_name['TxnResponse'] = _TXNRESPONSE
+DESCRIPTOR.message_types_by_name['WatchRequest'] = _WATCHREQUEST
+DESCRIPTOR.message_types_by_name['WatchCreateRequest'] = _WATCHCREATEREQUEST
+DESCRIPTOR.message_types_by_name['WatchCancelRequest'] = _WATCHCANCELREQUEST
+DESCRIPTOR.message_types_by_name['WatchProgressRequest'] = _WATCHPROGRESSREQUEST
+DESCRIPTOR.message_types_by_name['WatchResponse'] = _WATCHRESPONSE
+DESCRIPTOR.message_types_by_name['LeaseGrantRequest'] = _LEASEGRANTREQUEST
+DESCRIPTOR.message_types_by_name['LeaseGrantResponse'] = _LEASEGRANTRESPONSE
+DESCRIPTOR.message_types_by_name['LeaseRevokeRequest'] = _LEASEREVOKEREQUEST
+DESCRIPTOR.message_types_by_name['LeaseRevokeResponse'] = _LEASEREVOKERESPONSE
+DESCRIPTOR.message_types_by_name['LeaseKeepAliveRequest'] = _LEASEKEEPALIVEREQUEST
+DESCRIPTOR.message_types_by_name['LeaseKeepAliveResponse'] = _LEASEKEEPALIVERESPONSE
+DESCRIPTOR.message_types_by_name['CompactionRequest'] = _COMPACTIONREQUEST
+DESCRIPTOR.message_types_by_name['CompactionResponse'] = _COMPACTIONRESPONSE
+DESCRIPTOR.message_types_by_name['Member'] = _MEMBER
+DESCRIPTOR.message_types_by_name['MemberListRequest'] = _MEMBERLISTREQUEST
+DESCRIPTOR.message_types_by_name['MemberListResponse'] = _MEMBERLISTRESPONSE
+DESCRIPTOR.message_types_by_name['DefragmentRequest'] = _DEFRAGMENTREQUEST
+DESCRIPTOR.message_types_by_name['DefragmentResponse'] = _DEFRAGMENTRESPONSE
+DESCRIPTOR.message_types_by_name['HashKVRequest'] = _HASHKVREQUEST
+DESCRIPTOR.message_types_by_name['HashKVResponse'] = _HASHKVRESPONSE
+DESCRIPTOR.message_types_by_name['StatusRequest'] = _STATUSREQUEST
+DESCRIPTOR.message_types_by_name['StatusResponse'] = _STATUSRESPONSE
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+ResponseHeader = _reflection.GeneratedProtocolMessageType('ResponseHeader', (_message.Message,), {
+  'DESCRIPTOR' : _RESPONSEHEADER,
+  '__module__' : 'rpc_pb2'
+  # @@protoc_insertion_point(class_scope:etcdserverpb.ResponseHeader)
+  })
+_sym_db.RegisterMessage(ResponseHeader)
+
+RangeRequest = _reflection.GeneratedProtocolMessageType('RangeRequest', (_message.Message,), {
+  'DESCRIPTOR' : _RANGEREQUEST,
+  '__module__' : 'rpc_pb2'
+  # @@protoc_insertion_point(class_scope:etcdserverpb.RangeRequest)
+  })
+_sym_db.RegisterMessage(RangeRequest)
+
+RangeResponse = _reflection.GeneratedProtocolMessageType('RangeResponse', (_message.Message,), {
+  'DESCRIPTOR' : _RANGERESPONSE,
+  '__module__' : 'rpc_pb2'
+  # @@protoc_insertion_point(class_scope:etcdserverpb.RangeResponse)
+  })
+_sym_db.RegisterMessage(RangeResponse)
+
+PutRequest = _reflection.GeneratedProtocolMessageType('PutRequest', (_message.Message,), {
+  'DESCRIPTOR' : _PUTREQUEST,
+  '__module__' : 'rpc_pb2'
+  # @@protoc_insertion_point(class_scope:etcdserverpb.PutRequest)
+  })
+_sym_db.RegisterMessage(PutRequest)
+
+PutResponse = _reflection.GeneratedProtocolMessageType('PutResponse', (_message.Message,), {
+  'DESCRIPTOR' : _PUTRESPONSE,
+  '__module__' : 'rpc_pb2'
+  # @@protoc_insertion_point(class_scope:etcdserverpb.PutResponse)
+  })
+_sym_db.RegisterMessage(PutResponse)
+
+DeleteRangeRequest = _reflection.GeneratedProtocolMessageType('DeleteRangeRequest', (_message.Message,), {
+  'DESCRIPTOR' : _DELETERANGEREQUEST,
+  '__module__' : 'rpc_pb2'
+  # @@protoc_insertion_point(class_scope:etcdserverpb.DeleteRangeRequest)
+  })
+_sym_db.RegisterMessage(DeleteRangeRequest)
+
+DeleteRangeResponse = _reflection.GeneratedProtocolMessageType('DeleteRangeResponse', (_message.Message,), {
+  'DESCRIPTOR' : _DELETERANGERESPONSE,
+  '__module__' : 'rpc_pb2'
+  # @@protoc_insertion_point(class_scope:etcdserverpb.DeleteRangeResponse)
+  })
+_sym_db.RegisterMessage(DeleteRangeResponse)
+
+RequestOp = _reflection.GeneratedProtocolMessageType('RequestOp', (_message.Message,), {
+  'DESCRIPTOR' : _REQUESTOP,
+  '__module__' : 'rpc_pb2'
+  # @@protoc_insertion_point(class_scope:etcdserverpb.RequestOp)
+  })
+_sym_db.RegisterMessage(RequestOp)
+
+ResponseOp = _reflection.GeneratedProtocolMessageType('ResponseOp', (_message.Message,), {
+  'DESCRIPTOR' : _RESPONSEOP,
+  '__module__' : 'rpc_pb2'
+  # @@protoc_insertion_point(class_scope:etcdserverpb.ResponseOp)
+  })
+_sym_db.RegisterMessage(ResponseOp)
+
+Compare = _reflection.GeneratedProtocolMessageType('Compare', (_message.Message,), {
+  'DESCRIPTOR' : _COMPARE,
+  '__module__' : 'rpc_pb2'
+  # @@protoc_insertion_point(class_scope:etcdserverpb.Compare)
+  })
+_sym_db.RegisterMessage(Compare)
+
+TxnRequest = _reflection.GeneratedProtocolMessageType('TxnRequest', (_message.Message,), {
+  'DESCRIPTOR' : _TXNREQUEST,
+  '__module__' : 'rpc_pb2'
+  # @@protoc_insertion_point(class_scope:etcdserverpb.TxnRequest)
+  })
+_sym_db.RegisterMessage(TxnRequest)
+
+TxnResponse = _reflection.GeneratedProtocolMessageType('TxnResponse', (_message.Message,), {
+  'DESCRIPTOR' : _TXNRESPONSE,
+  '__module__' : 'rpc_pb2'
+  # @@protoc_insertion_point(class_scope:etcdserverpb.TxnResponse)
+  })
+_sym_db.RegisterMessage(TxnResponse)
+
+WatchRequest = _reflection.GeneratedProtocolMessageType('WatchRequest', (_message.Message,), {
+  'DESCRIPTOR' : _WATCHREQUEST,
+  '__module__' : 'rpc_pb2'
+  # @@protoc_insertion_point(class_scope:etcdserverpb.WatchRequest)
+  })
+_sym_db.RegisterMessage(WatchRequest)
+
+WatchCreateRequest = _reflection.GeneratedProtocolMessageType('WatchCreateRequest', (_message.Message,), {
+  'DESCRIPTOR' : _WATCHCREATEREQUEST,
+  '__module__' : 'rpc_pb2'
+  # @@protoc_insertion_point(class_scope:etcdserverpb.WatchCreateRequest)
+  })
+_sym_db.RegisterMessage(WatchCreateRequest)
+
+WatchCancelRequest = _reflection.GeneratedProtocolMessageType('WatchCancelRequest', (_message.Message,), {
+  'DESCRIPTOR' : _WATCHCANCELREQUEST,
+  '__module__' : 'rpc_pb2'
+  # @@protoc_insertion_point(class_scope:etcdserverpb.WatchCancelRequest)
+  })
+_sym_db.RegisterMessage(WatchCancelRequest)
+
+WatchProgressRequest = _reflection.GeneratedProtocolMessageType('WatchProgressRequest', (_message.Message,), {
+  'DESCRIPTOR' : _WATCHPROGRESSREQUEST,
+  '__module__' : 'rpc_pb2'
+  # @@protoc_insertion_point(class_scope:etcdserverpb.WatchProgressRequest)
+  })
+_sym_db.RegisterMessage(WatchProgressRequest)
+
+WatchResponse = _reflection.GeneratedProtocolMessageType('WatchResponse', (_message.Message,), {
+  'DESCRIPTOR' : _WATCHRESPONSE,
+  '__module__' : 'rpc_pb2'
+  # @@protoc_insertion_point(class_scope:etcdserverpb.WatchResponse)
+  })
+_sym_db.RegisterMessage(WatchResponse)
+
+LeaseGrantRequest = _reflection.GeneratedProtocolMessageType('LeaseGrantRequest', (_message.Message,), {
+  'DESCRIPTOR' : _LEASEGRANTREQUEST,
+  '__module__' : 'rpc_pb2'
+  # @@protoc_insertion_point(class_scope:etcdserverpb.LeaseGrantRequest)
+  })
+_sym_db.RegisterMessage(LeaseGrantRequest)
+
+LeaseGrantResponse = _reflection.GeneratedProtocolMessageType('LeaseGrantResponse', (_message.Message,), {
+  'DESCRIPTOR' : _LEASEGRANTRESPONSE,
+  '__module__' : 'rpc_pb2'
+  # @@protoc_insertion_point(class_scope:etcdserverpb.LeaseGrantResponse)
+  })
+_sym_db.RegisterMessage(LeaseGrantResponse)
+
+LeaseRevokeRequest = _reflection.GeneratedProtocolMessageType('LeaseRevokeRequest', (_message.Message,), {
+  'DESCRIPTOR' : _LEASEREVOKEREQUEST,
+  '__module__' : 'rpc_pb2'
+  # @@protoc_insertion_point(class_scope:etcdserverpb.LeaseRevokeRequest)
+  })
+_sym_db.RegisterMessage(LeaseRevokeRequest)
+
+LeaseRevokeResponse = _reflection.GeneratedProtocolMessageType('LeaseRevokeResponse', (_message.Message,), {
+  'DESCRIPTOR' : _LEASEREVOKERESPONSE,
+  '__module__' : 'rpc_pb2'
+  # @@protoc_insertion_point(class_scope:etcdserverpb.LeaseRevokeResponse)
+  })
+_sym_db.RegisterMessage(LeaseRevokeResponse)
+
+LeaseKeepAliveRequest = _reflection.GeneratedProtocolMessageType('LeaseKeepAliveRequest', (_message.Message,), {
+  'DESCRIPTOR' : _LEASEKEEPALIVEREQUEST,
+  '__module__' : 'rpc_pb2'
+  # @@protoc_insertion_point(class_scope:etcdserverpb.LeaseKeepAliveRequest)
+  })
+_sym_db.RegisterMessage(LeaseKeepAliveRequest)
+
+LeaseKeepAliveResponse = _reflection.GeneratedProtocolMessageType('LeaseKeepAliveResponse', (_message.Message,), {
+  'DESCRIPTOR' : _LEASEKEEPALIVERESPONSE,
+  '__module__' : 'rpc_pb2'
+  # @@protoc_insertion_point(class_scope:etcdserverpb.LeaseKeepAliveResponse)
+  })
+_sym_db.RegisterMessage(LeaseKeepAliveResponse)
+
+CompactionRequest = _reflection.GeneratedProtocolMessageType('CompactionRequest', (_message.Message,), {
+  'DESCRIPTOR' : _COMPACTIONREQUEST,
+  '__module__' : 'rpc_pb2'
+  # @@protoc_insertion_point(class_scope:etcdserverpb.CompactionRequest)
+  })
+_sym_db.RegisterMessage(CompactionRequest)
+
+CompactionResponse = _reflection.GeneratedProtocolMessageType('CompactionResponse', (_message.Message,), {
+  'DESCRIPTOR' : _COMPACTIONRESPONSE,
+  '__module__' : 'rpc_pb2'
+  # @@protoc_insertion_point(class_scope:etcdserverpb.CompactionResponse)
+  })
+_sym_db.RegisterMessage(CompactionResponse)
+
+Member = _reflection.GeneratedProtocolMessageType('Member', (_message.Message,), {
+  'DESCRIPTOR' : _MEMBER,
+  '__module__' : 'rpc_pb2'
+  # @@protoc_insertion_point(class_scope:etcdserverpb.Member)
+  })
+_sym_db.RegisterMessage(Member)
+
+MemberListRequest = _reflection.GeneratedProtocolMessageType('MemberListRequest', (_message.Message,), {
+  'DESCRIPTOR' : _MEMBERLISTREQUEST,
+  '__module__' : 'rpc_pb2'
+  # @@protoc_insertion_point(class_scope:etcdserverpb.MemberListRequest)
+  })
+_sym_db.RegisterMessage(MemberListRequest)
+
+MemberListResponse = _reflection.GeneratedProtocolMessageType('MemberListResponse', (_message.Message,), {
+  'DESCRIPTOR' : _MEMBERLISTRESPONSE,
+  '__module__' : 'rpc_pb2'
+  # @@protoc_insertion_point(class_scope:etcdserverpb.MemberListResponse)
+  })
+_sym_db.RegisterMessage(MemberListResponse)
+
+DefragmentRequest = _reflection.GeneratedProtocolMessageType('DefragmentRequest', (_message.Message,), {
+  'DESCRIPTOR' : _DEFRAGMENTREQUEST,
+  '__module__' : 'rpc_pb2'
+  # @@protoc_insertion_point(class_scope:etcdserverpb.DefragmentRequest)
+  })
+_sym_db.RegisterMessage(DefragmentRequest)
+
+DefragmentResponse = _reflection.GeneratedProtocolMessageType('DefragmentResponse', (_message.Message,), {
+  'DESCRIPTOR' : _DEFRAGMENTRESPONSE,
+  '__module__' : 'rpc_pb2'
+  # @@protoc_insertion_point(class_scope:etcdserverpb.DefragmentResponse)
+  })
+_sym_db.RegisterMessage(DefragmentResponse)
+
+HashKVRequest = _reflection.GeneratedProtocolMessageType('HashKVRequest', (_message.Message,), {
+  'DESCRIPTOR' : _HASHKVREQUEST,
+  '__module__' : 'rpc_pb2'
+  # @@protoc_insertion_point(class_scope:etcdserverpb.HashKVRequest)
+  })
+_sym_db.RegisterMessage(HashKVRequest)
+
+HashKVResponse = _reflection.GeneratedProtocolMessageType('HashKVResponse', (_message.Message,), {
+  'DESCRIPTOR' : _HASHKVRESPONSE,
+  '__module__' : 'rpc_pb2'
+  # @@protoc_insertion_point(class_scope:etcdserverpb.HashKVResponse)
+  })
+_sym_db.RegisterMessage(HashKVResponse)
+
+StatusRequest = _reflection.GeneratedProtocolMessageType('StatusRequest', (_message.Message,), {
+  'DESCRIPTOR' : _STATUSREQUEST,
+  '__module__' : 'rpc_pb2'
+  # @@protoc_insertion_point(class_scope:etcdserverpb.StatusRequest)
+  })
+_sym_db.RegisterMessage(StatusRequest)
+
+StatusResponse = _reflection.GeneratedProtocolMessageType('StatusResponse', (_message.Message,), {
+  'DESCRIPTOR' : _STATUSRESPONSE,
+  '__module__' : 'rpc_pb2'
+  # @@protoc_insertion_point(class_scope:etcdserverpb.StatusResponse)
+  })
+_sym_db.RegisterMessage(StatusResponse)
+
+
+
+_KV = _descriptor.ServiceDescriptor(
+  name='KV',
+  full_name='etcdserverpb.KV',
+  file=DESCRIPTOR,
+  index=0,
+  serialized_options=None,
+  create_key=_descriptor._internal_create_key,
+  serialized_start=4308,
+  serialized_end=4670,
+  methods=[
+  _descriptor.MethodDescriptor(
+    name='Range',
+    full_name='etcdserverpb.KV.Range',
+    index=0,
+    containing_service=None,
+    input_type=_RANGEREQUEST,
+    output_type=_RANGERESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='Put',
+    full_name='etcdserverpb.KV.Put',
+    index=1,
+    containing_service=None,
+    input_type=_PUTREQUEST,
+    output_type=_PUTRESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='DeleteRange',
+    full_name='etcdserverpb.KV.DeleteRange',
+    index=2,
+    containing_service=None,
+    input_type=_DELETERANGEREQUEST,
+    output_type=_DELETERANGERESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='Txn',
+    full_name='etcdserverpb.KV.Txn',
+    index=3,
+    containing_service=None,
+    input_type=_TXNREQUEST,
+    output_type=_TXNRESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='Compact',
+    full_name='etcdserverpb.KV.Compact',
+    index=4,
+    containing_service=None,
+    input_type=_COMPACTIONREQUEST,
+    output_type=_COMPACTIONRESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
 ])
 _sym_db.RegisterServiceDescriptor(_KV)
 
 DESCRIPTOR.services_by_name['KV'] = _KV
 
+
+_WATCH = _descriptor.ServiceDescriptor(
+  name='Watch',
+  full_name='etcdserverpb.Watch',
+  file=DESCRIPTOR,
+  index=1,
+  serialized_options=None,
+  create_key=_descriptor._internal_create_key,
+  serialized_start=4672,
+  serialized_end=4751,
+  methods=[
+  _descriptor.MethodDescriptor(
+    name='Watch',
+    full_name='etcdserverpb.Watch.Watch',
+    index=0,
+    containing_service=None,
+    input_type=_WATCHREQUEST,
+    output_type=_WATCHRESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+])
+_sym_db.RegisterServiceDescriptor(_WATCH)
+
+DESCRIPTOR.services_by_name['Watch'] = _WATCH
+
+
+_LEASE = _descriptor.ServiceDescriptor(
+  name='Lease',
+  full_name='etcdserverpb.Lease',
+  file=DESCRIPTOR,
+  index=2,
+  serialized_options=None,
+  create_key=_descriptor._internal_create_key,
+  serialized_start=4754,
+  serialized_end=5029,
+  methods=[
+  _descriptor.MethodDescriptor(
+    name='LeaseGrant',
+    full_name='etcdserverpb.Lease.LeaseGrant',
+    index=0,
+    containing_service=None,
+    input_type=_LEASEGRANTREQUEST,
+    output_type=_LEASEGRANTRESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='LeaseRevoke',
+    full_name='etcdserverpb.Lease.LeaseRevoke',
+    index=1,
+    containing_service=None,
+    input_type=_LEASEREVOKEREQUEST,
+    output_type=_LEASEREVOKERESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='LeaseKeepAlive',
+    full_name='etcdserverpb.Lease.LeaseKeepAlive',
+    index=2,
+    containing_service=None,
+    input_type=_LEASEKEEPALIVEREQUEST,
+    output_type=_LEASEKEEPALIVERESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+])
+_sym_db.RegisterServiceDescriptor(_LEASE)
+
+DESCRIPTOR.services_by_name['Lease'] = _LEASE
+
+
+_CLUSTER = _descriptor.ServiceDescriptor(
+  name='Cluster',
+  full_name='etcdserverpb.Cluster',
+  file=DESCRIPTOR,
+  index=3,
+  serialized_options=None,
+  create_key=_descriptor._internal_create_key,
+  serialized_start=5031,
+  serialized_end=5123,
+  methods=[
+  _descriptor.MethodDescriptor(
+    name='MemberList',
+    full_name='etcdserverpb.Cluster.MemberList',
+    index=0,
+    containing_service=None,
+    input_type=_MEMBERLISTREQUEST,
+    output_type=_MEMBERLISTRESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+])
+_sym_db.RegisterServiceDescriptor(_CLUSTER)
+
+DESCRIPTOR.services_by_name['Cluster'] = _CLUSTER
+
+
+_MAINTENANCE = _descriptor.ServiceDescriptor(
+  name='Maintenance',
+  full_name='etcdserverpb.Maintenance',
+  file=DESCRIPTOR,
+  index=4,
+  serialized_options=None,
+  create_key=_descriptor._internal_create_key,
+  serialized_start=5126,
+  serialized_end=5364,
+  methods=[
+  _descriptor.MethodDescriptor(
+    name='Status',
+    full_name='etcdserverpb.Maintenance.Status',
+    index=0,
+    containing_service=None,
+    input_type=_STATUSREQUEST,
+    output_type=_STATUSRESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='Defragment',
+    full_name='etcdserverpb.Maintenance.Defragment',
+    index=1,
+    containing_service=None,
+    input_type=_DEFRAGMENTREQUEST,
+    output_type=_DEFRAGMENTRESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='HashKV',
+    full_name='etcdserverpb.Maintenance.HashKV',
+    index=2,
+    containing_service=None,
+    input_type=_HASHKVREQUEST,
+    output_type=_HASHKVRESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+])
+_sym_db.RegisterServiceDescriptor(_MAINTENANCE)
+
+DESCRIPTOR.services_by_name['Maintenance'] = _MAINTENANCE
+
 # @@protoc_insertion_point(module_scope)
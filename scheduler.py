@@ -0,0 +1,195 @@
+import asyncio
+import heapq
+import itertools
+import time
+from typing import Dict, List, Optional, Tuple
+
+import grpc
+
+INTERACTIVE = 0
+BULK = 1
+
+
+class TokenBucket:
+    """
+    Token bucket whose waiters are served by priority, then in arrival
+    order, so a queue of bulk calls cannot hold back an interactive one.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None) -> None:
+        self.rate = rate
+        # below one token the bucket could never admit anything
+        self.burst = max(burst if burst is not None else rate, 1)
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self.waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self.counter = itertools.count()
+        self.pump: Optional[asyncio.Task] = None
+
+    def wait_time(self) -> float:
+        """Takes a token and returns 0, or returns how long until one is available."""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0
+        return (1 - self.tokens) / self.rate
+
+    async def acquire(self, priority: int = INTERACTIVE) -> None:
+        if not self.waiters and not self.wait_time():
+            return
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self.waiters, (priority, next(self.counter), future))
+        if self.pump is None or self.pump.done():
+            self.pump = asyncio.ensure_future(self._pump())
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # the token was handed over already, give it back
+                self.tokens = min(self.burst, self.tokens + 1)
+            raise
+
+    async def _pump(self) -> None:
+        """Hands out tokens to the waiters as they become available."""
+        while self.waiters:
+            if self.waiters[0][2].cancelled():
+                heapq.heappop(self.waiters)
+                continue
+            delay = self.wait_time()
+            if delay:
+                await asyncio.sleep(delay)
+                continue
+            _, _, future = heapq.heappop(self.waiters)
+            future.set_result(None)
+
+
+class Scheduler:
+    """
+    Client-side admission control for KV RPCs: token buckets per method and
+    per key prefix and an adaptive concurrency limit, all admitting waiters
+    by priority. The limit grows additively while latency stays within
+    tolerance times the lowest latency seen recently, and shrinks
+    multiplicatively on slower calls or RESOURCE_EXHAUSTED, at most once
+    per round trip: calls that started before the last decrease are not
+    counted again.
+    """
+
+    def __init__(self,
+                 method_rates: Optional[Dict[str, Tuple[float, float]]] = None,
+                 prefix_rates: Optional[Dict[bytes, Tuple[float, float]]] = None,
+                 min_concurrency: int = 1,
+                 max_concurrency: int = 256,
+                 tolerance: float = 2.0,
+                 baseline_interval: float = 30.0) -> None:
+        self.method_buckets = {method: TokenBucket(*rate)
+                               for method, rate in (method_rates or {}).items()}
+        self.prefix_buckets = {prefix: TokenBucket(*rate)
+                               for prefix, rate in (prefix_rates or {}).items()}
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.tolerance = tolerance
+        # the baseline is the lowest latency of the previous or current
+        # interval, so it follows a slower network instead of sticking
+        # to a minimum seen long ago
+        self.baseline_interval = baseline_interval
+        self.min_latency = float("inf")
+        self.interval_min = float("inf")
+        self.interval_start = time.monotonic()
+        self.decreased_at = 0.0
+        self.limit = float(max_concurrency)
+        self.inflight = 0
+        self.waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self.counter = itertools.count()
+
+    def buckets(self, method: str, key: bytes) -> List[TokenBucket]:
+        buckets = [bucket for prefix, bucket in self.prefix_buckets.items()
+                   if key.startswith(prefix)]
+        if method in self.method_buckets:
+            buckets.append(self.method_buckets[method])
+        return buckets
+
+    async def acquire(self, method: str, key: bytes, priority: int = INTERACTIVE) -> None:
+        for bucket in self.buckets(method, key):
+            await bucket.acquire(priority)
+        if self.inflight < int(self.limit) and not self.waiters:
+            self.inflight += 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self.waiters, (priority, next(self.counter), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # the slot was handed over already, give it back
+                self.inflight -= 1
+                self._wake()
+            raise
+
+    def _update_baseline(self, now: float, latency: float) -> None:
+        if now - self.interval_start >= self.baseline_interval:
+            self.min_latency = self.interval_min
+            self.interval_min = float("inf")
+            self.interval_start = now
+        self.interval_min = min(self.interval_min, latency)
+        self.min_latency = min(self.min_latency, latency)
+
+    def release(self, latency: float, code: Optional[grpc.StatusCode] = None) -> None:
+        self.inflight -= 1
+        now = time.monotonic()
+        exhausted = code == grpc.StatusCode.RESOURCE_EXHAUSTED
+        if not exhausted:
+            self._update_baseline(now, latency)
+        if exhausted or latency > self.min_latency * self.tolerance:
+            if now - latency >= self.decreased_at:
+                factor = 0.5 if exhausted else 0.9
+                self.limit = max(self.min_concurrency, self.limit * factor)
+                self.decreased_at = now
+        else:
+            self.limit = min(self.max_concurrency, self.limit + 1 / self.limit)
+        self._wake()
+
+    def _wake(self) -> None:
+        while self.waiters and self.inflight < int(self.limit):
+            _, _, future = heapq.heappop(self.waiters)
+            if future.cancelled():
+                continue
+            self.inflight += 1
+            future.set_result(None)
+
+
+class _ScheduledMethod:
+
+    def __init__(self, call, name: str, scheduler: Scheduler, priority: int) -> None:
+        self.call = call
+        self.name = name
+        self.scheduler = scheduler
+        self.priority = priority
+
+    async def __call__(self, request, **kwargs):
+        await self.scheduler.acquire(self.name, request.key, self.priority)
+        start = time.monotonic()
+        code = None
+        try:
+            return await self.call(request, **kwargs)
+        except grpc.aio.AioRpcError as e:
+            code = e.code()
+            raise
+        finally:
+            self.scheduler.release(time.monotonic() - start, code)
+
+
+class ScheduledStub:
+    """
+    Drop-in replacement for KVStub that routes calls through a Scheduler.
+    Stubs with different priorities can share one scheduler, e.g. an
+    interactive one for reads and a bulk one for a background loader.
+    """
+
+    def __init__(self, stub, scheduler: Scheduler, priority: int = INTERACTIVE) -> None:
+        self.stub = stub
+        self.scheduler = scheduler
+        self.Range = _ScheduledMethod(stub.Range, "Range", scheduler, priority)
+        self.Put = _ScheduledMethod(stub.Put, "Put", scheduler, priority)
+        self.DeleteRange = _ScheduledMethod(stub.DeleteRange, "DeleteRange", scheduler, priority)
@@ -0,0 +1,663 @@
+"""
+In-memory etcd stand-in for load and resilience testing without a cluster.
+
+It implements the KV (with MVCC revisions, range_end semantics, limit/more
+paging, Txn and Compact), Watch, Lease, Cluster and Maintenance services of
+the protos in this repository. Faults can be injected: per-RPC latency with
+jitter, a random error rate and periodic leader changes during which every
+RPC fails with UNAVAILABLE.
+
+    python standin.py --port 2379 --latency 0.002 --jitter 0.001 --error-rate 0.01
+"""
+import asyncio
+import bisect
+import itertools
+import logging
+import random
+import time
+import zlib
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import click
+import grpc
+
+from kv_pb2 import Event, KeyValue
+from rpc_pb2 import (CompactionResponse, Compare, DefragmentResponse, DeleteRangeResponse,
+                     HashKVResponse, LeaseGrantResponse, LeaseKeepAliveResponse,
+                     LeaseRevokeResponse, Member, MemberListResponse, PutResponse, RangeRequest,
+                     RangeResponse, ResponseHeader, ResponseOp, StatusResponse, TxnResponse,
+                     WatchCreateRequest, WatchResponse)
+import rpc_pb2_grpc
+
+logger = logging.getLogger(__name__)
+
+SORT_FIELDS = {
+    RangeRequest.KEY: "key",
+    RangeRequest.VERSION: "version",
+    RangeRequest.CREATE: "create_revision",
+    RangeRequest.MOD: "mod_revision",
+    RangeRequest.VALUE: "value",
+}
+COMPARE_FIELDS = {
+    Compare.VERSION: "version",
+    Compare.CREATE: "create_revision",
+    Compare.MOD: "mod_revision",
+    Compare.VALUE: "value",
+    Compare.LEASE: "lease",
+}
+
+
+class StandinError(Exception):
+
+    def __init__(self, code: grpc.StatusCode, details: str) -> None:
+        super().__init__(details)
+        self.code = code
+        self.details = details
+
+
+class _History:
+    """Revisions of one key; a None value is a deletion (tombstone)."""
+
+    __slots__ = ("revisions", "values")
+
+    def __init__(self) -> None:
+        self.revisions: List[int] = []
+        self.values: List[Optional[KeyValue]] = []
+
+    def at(self, revision: int) -> Optional[KeyValue]:
+        if not revision:
+            return self.values[-1] if self.values else None
+        i = bisect.bisect_right(self.revisions, revision)
+        return self.values[i - 1] if i else None
+
+
+class Store:
+
+    def __init__(self, member_id: int = 1) -> None:
+        self.revision = 1
+        self.compacted = 0
+        self.raft_term = 1
+        self.member_id = member_id
+        self.leader = member_id
+        # every key with a history, live or not, and the live ones at the
+        # current revision; both sorted
+        self.keys: List[bytes] = []
+        self.live: List[bytes] = []
+        self.history: Dict[bytes, _History] = {}
+        self.events: List[Event] = []
+        self.watchers: List["Watcher"] = []
+        # lease id -> [ttl, deadline, attached keys]
+        self.leases: Dict[int, list] = {}
+        self.lease_ids = itertools.count(0x694d7a0000000000 + random.randrange(1 << 24))
+        # bytes freed by compaction that a Defragment would give back
+        self.garbage = 0
+
+    def header(self) -> ResponseHeader:
+        return ResponseHeader(cluster_id=0x1, member_id=self.member_id,
+                              revision=self.revision, raft_term=self.raft_term)
+
+    def get(self, key: bytes, revision: int = 0) -> Optional[KeyValue]:
+        history = self.history.get(key)
+        return history.at(revision) if history is not None else None
+
+    def iter_keys(self, key: bytes, range_end: bytes) -> Iterator[bytes]:
+        if not range_end:
+            if key in self.history:
+                yield key
+            return
+        start = bisect.bisect_left(self.keys, key)
+        for k in itertools.islice(self.keys, start, None):
+            if range_end != b"\0" and k >= range_end:
+                break
+            yield k
+
+    def check_revision(self, revision: int) -> None:
+        if revision > self.revision:
+            raise StandinError(grpc.StatusCode.OUT_OF_RANGE,
+                               "etcdserver: mvcc: required revision is a future revision")
+        if revision and revision < self.compacted:
+            raise StandinError(grpc.StatusCode.OUT_OF_RANGE,
+                               "etcdserver: mvcc: required revision has been compacted")
+
+    def _span(self, keys: List[bytes], key: bytes, range_end: bytes) -> Tuple[int, int]:
+        """Indices of keys in [key, range_end) of a sorted key list."""
+        start = bisect.bisect_left(keys, key)
+        if not range_end:
+            return start, start + 1 if start < len(keys) and keys[start] == key else start
+        if range_end == b"\0":
+            return start, len(keys)
+        return start, max(start, bisect.bisect_left(keys, range_end, start))
+
+    def _events_after(self, revision: int) -> int:
+        """Index of the first event with a revision after revision."""
+        low, high = 0, len(self.events)
+        while low < high:
+            middle = (low + high) // 2
+            if self.events[middle].kv.mod_revision <= revision:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def count(self, key: bytes, range_end: bytes, revision: int = 0) -> int:
+        """
+        Live keys in the range at revision, from the live index corrected by
+        the keys written since, so a page of a large range stays cheap.
+        """
+        start, stop = self._span(self.live, key, range_end)
+        count = stop - start
+        if not revision or revision >= self.revision:
+            return count
+        touched = {event.kv.key for event in self.events[self._events_after(revision):]}
+        for k in touched:
+            if k == key if not range_end else k >= key and (range_end == b"\0" or k < range_end):
+                count += (self.get(k, revision) is not None) - (self.get(k) is not None)
+        return count
+
+    def range(self, request: RangeRequest) -> RangeResponse:
+        if not request.key:
+            raise StandinError(grpc.StatusCode.INVALID_ARGUMENT, "etcdserver: key is not provided")
+        revision = max(request.revision, 0)
+        self.check_revision(revision)
+        filtered = (request.min_mod_revision or request.max_mod_revision or
+                    request.min_create_revision or request.max_create_revision)
+        ordered = request.sort_order == RangeRequest.NONE and request.sort_target == RangeRequest.KEY
+        if not filtered and (ordered or request.count_only):
+            return self._range_page(request, revision)
+        kvs = []
+        for k in self.iter_keys(request.key, request.range_end):
+            kv = self.get(k, revision)
+            if kv is None:
+                continue
+            if request.min_mod_revision and kv.mod_revision < request.min_mod_revision:
+                continue
+            if request.max_mod_revision and kv.mod_revision > request.max_mod_revision:
+                continue
+            if request.min_create_revision and kv.create_revision < request.min_create_revision:
+                continue
+            if request.max_create_revision and kv.create_revision > request.max_create_revision:
+                continue
+            kvs.append(kv)
+        response = RangeResponse(header=self.header(), count=len(kvs))
+        if request.count_only:
+            return response
+        if request.sort_order != RangeRequest.NONE or request.sort_target != RangeRequest.KEY:
+            field = SORT_FIELDS[request.sort_target]
+            kvs.sort(key=lambda kv: getattr(kv, field),
+                     reverse=request.sort_order == RangeRequest.DESCEND)
+        if request.limit and len(kvs) > request.limit:
+            kvs = kvs[:request.limit]
+            response.more = True
+        for kv in kvs:
+            item = response.kvs.add()
+            item.CopyFrom(kv)
+            if request.keys_only:
+                item.ClearField("value")
+        return response
+
+    def _range_page(self, request: RangeRequest, revision: int) -> RangeResponse:
+        """An unfiltered range in key order: stops at limit and counts separately."""
+        response = RangeResponse(header=self.header(),
+                                 count=self.count(request.key, request.range_end, revision))
+        if request.count_only:
+            return response
+        for k in self.iter_keys(request.key, request.range_end):
+            kv = self.get(k, revision)
+            if kv is None:
+                continue
+            if request.limit and len(response.kvs) == request.limit:
+                response.more = True
+                break
+            item = response.kvs.add()
+            item.CopyFrom(kv)
+            if request.keys_only:
+                item.ClearField("value")
+        return response
+
+    def _write(self, key: bytes, kv: Optional[KeyValue], prev: Optional[KeyValue]) -> None:
+        history = self.history.get(key)
+        if kv is None and prev is not None:
+            del self.live[bisect.bisect_left(self.live, key)]
+        elif kv is not None and prev is None:
+            bisect.insort(self.live, key)
+        if history is None:
+            bisect.insort(self.keys, key)
+            history = self.history[key] = _History()
+        history.revisions.append(self.revision)
+        history.values.append(kv)
+        if kv is None:
+            event = Event(type=Event.DELETE, kv=KeyValue(key=key, mod_revision=self.revision))
+        else:
+            event = Event(type=Event.PUT, kv=kv)
+        if prev is not None:
+            event.prev_kv.CopyFrom(prev)
+        self.events.append(event)
+        for watcher in self.watchers:
+            watcher.notify(event)
+
+    def check_lease(self, lease: int) -> None:
+        if lease and lease not in self.leases:
+            raise StandinError(grpc.StatusCode.NOT_FOUND, "etcdserver: requested lease not found")
+
+    def put(self, request) -> PutResponse:
+        """Applies a put at the current revision; callers bump the revision first."""
+        prev = self.get(request.key)
+        if prev is not None and prev.lease in self.leases:
+            self.leases[prev.lease][2].discard(request.key)
+        kv = KeyValue(key=request.key, value=request.value, lease=request.lease,
+                      mod_revision=self.revision,
+                      create_revision=prev.create_revision if prev else self.revision,
+                      version=prev.version + 1 if prev else 1)
+        if request.lease:
+            self.leases[request.lease][2].add(request.key)
+        self._write(request.key, kv, prev)
+        response = PutResponse(header=self.header())
+        if request.prev_kv and prev is not None:
+            response.prev_kv.CopyFrom(prev)
+        return response
+
+    def live_keys(self, key: bytes, range_end: bytes) -> List[KeyValue]:
+        kvs = (self.get(k) for k in self.iter_keys(key, range_end))
+        return [kv for kv in kvs if kv is not None]
+
+    def delete(self, request) -> DeleteRangeResponse:
+        """Applies a delete at the current revision; callers bump the revision first."""
+        deleted = self.live_keys(request.key, request.range_end)
+        for kv in deleted:
+            if kv.lease in self.leases:
+                self.leases[kv.lease][2].discard(kv.key)
+            self._write(kv.key, None, kv)
+        response = DeleteRangeResponse(header=self.header(), deleted=len(deleted))
+        if request.prev_kv:
+            response.prev_kvs.extend(deleted)
+        return response
+
+    def compare(self, cmp: Compare) -> bool:
+        if cmp.range_end:
+            kvs = self.live_keys(cmp.key, cmp.range_end)
+        else:
+            kvs = [self.get(cmp.key) or KeyValue()]
+        target = cmp.WhichOneof("target_union")
+        expected = getattr(cmp, target) if target else 0
+        field = COMPARE_FIELDS[cmp.target]
+        for kv in kvs:
+            actual = getattr(kv, field)
+            if cmp.result == Compare.EQUAL and not actual == expected:
+                return False
+            if cmp.result == Compare.GREATER and not actual > expected:
+                return False
+            if cmp.result == Compare.LESS and not actual < expected:
+                return False
+            if cmp.result == Compare.NOT_EQUAL and not actual != expected:
+                return False
+        return True
+
+    def txn(self, request) -> TxnResponse:
+        succeeded = all(self.compare(cmp) for cmp in request.compare)
+        ops = request.success if succeeded else request.failure
+        kinds = [op.WhichOneof("request") for op in ops]
+        if "request_txn" in kinds:
+            raise StandinError(grpc.StatusCode.UNIMPLEMENTED, "nested txn is not supported")
+        for op, kind in zip(ops, kinds):
+            if kind == "request_put":
+                self.check_lease(op.request_put.lease)
+            elif kind == "request_range":
+                self.check_revision(max(op.request_range.revision, 0))
+        if any(kind != "request_range" for kind in kinds):
+            # all writes of a txn share one revision
+            self.revision += 1
+        response = TxnResponse(succeeded=succeeded)
+        for op, kind in zip(ops, kinds):
+            if kind == "request_range":
+                response.responses.append(ResponseOp(response_range=self.range(op.request_range)))
+            elif kind == "request_put":
+                response.responses.append(ResponseOp(response_put=self.put(op.request_put)))
+            else:
+                response.responses.append(ResponseOp(
+                    response_delete_range=self.delete(op.request_delete_range)))
+        response.header.CopyFrom(self.header())
+        return response
+
+    def compact(self, revision: int) -> None:
+        if revision <= self.compacted:
+            raise StandinError(grpc.StatusCode.OUT_OF_RANGE,
+                               "etcdserver: mvcc: required revision has been compacted")
+        self.check_revision(revision)
+        for key in list(self.keys):
+            history = self.history[key]
+            # keep the newest revision at or below the compaction point
+            # unless it is a tombstone
+            i = max(bisect.bisect_right(history.revisions, revision) - 1, 0)
+            if history.revisions[i] <= revision and history.values[i] is None:
+                i += 1
+            # like bbolt, freed space is only given back by a defragment
+            self.garbage += sum(kv.ByteSize() for kv in history.values[:i] if kv is not None)
+            del history.revisions[:i]
+            del history.values[:i]
+            if not history.revisions:
+                del self.history[key]
+                self.keys.remove(key)
+        self.events = [event for event in self.events if event.kv.mod_revision > revision]
+        self.compacted = revision
+
+    def grant(self, ttl: int, lease_id: int = 0) -> int:
+        lease_id = lease_id or next(self.lease_ids)
+        self.leases[lease_id] = [ttl, time.monotonic() + ttl, set()]
+        return lease_id
+
+    def revoke(self, lease_id: int) -> None:
+        _, _, keys = self.leases.pop(lease_id)
+        if not keys:
+            return
+        self.revision += 1
+        for key in sorted(keys):
+            prev = self.get(key)
+            if prev is not None:
+                self._write(key, None, prev)
+
+    def expire(self) -> None:
+        now = time.monotonic()
+        for lease_id, (_, deadline, _) in list(self.leases.items()):
+            if deadline < now:
+                self.revoke(lease_id)
+
+    def db_size(self) -> int:
+        live = sum(kv.ByteSize() for history in self.history.values()
+                   for kv in history.values if kv is not None)
+        return live + self.garbage
+
+    def hash(self, revision: int = 0) -> int:
+        value = 0
+        for key in self.keys:
+            history = self.history[key]
+            for rev, kv in zip(history.revisions, history.values):
+                if revision and rev > revision:
+                    break
+                value = zlib.crc32(key + (kv.SerializeToString() if kv is not None else b""), value)
+        return value
+
+
+class Faults:
+    """
+    Fault injection applied at the start of every RPC. During a simulated
+    leader election every RPC fails with UNAVAILABLE.
+    """
+
+    def __init__(self, latency: float = 0, jitter: float = 0, error_rate: float = 0,
+                 error_code: grpc.StatusCode = grpc.StatusCode.UNAVAILABLE,
+                 leader_change_interval: float = 0, election_timeout: float = 1.0) -> None:
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_code = error_code
+        self.leader_change_interval = leader_change_interval
+        self.election_timeout = election_timeout
+        self.electing_until = 0.0
+
+    async def inject(self, context) -> None:
+        delay = self.latency + (random.uniform(-self.jitter, self.jitter) if self.jitter else 0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if time.monotonic() < self.electing_until:
+            await context.abort(grpc.StatusCode.UNAVAILABLE, "etcdserver: leader changed")
+        if self.error_rate and random.random() < self.error_rate:
+            await context.abort(self.error_code, "standin: injected fault")
+
+    async def change_leaders(self, store: Store) -> None:
+        while self.leader_change_interval:
+            await asyncio.sleep(self.leader_change_interval)
+            self.electing_until = time.monotonic() + self.election_timeout
+            store.raft_term += 1
+            store.leader = random.randrange(1, 1 << 63)
+            logger.info("leader change, term %d", store.raft_term)
+
+
+async def _call(context, function, *args):
+    try:
+        return function(*args)
+    except StandinError as e:
+        await context.abort(e.code, e.details)
+
+
+class KVServicer(rpc_pb2_grpc.KVServicer):
+
+    def __init__(self, store: Store, faults: Faults) -> None:
+        self.store = store
+        self.faults = faults
+
+    async def Range(self, request, context):
+        await self.faults.inject(context)
+        return await _call(context, self.store.range, request)
+
+    def _put(self, request):
+        self.store.check_lease(request.lease)
+        self.store.revision += 1
+        return self.store.put(request)
+
+    async def Put(self, request, context):
+        await self.faults.inject(context)
+        return await _call(context, self._put, request)
+
+    def _delete(self, request):
+        if not self.store.live_keys(request.key, request.range_end):
+            return DeleteRangeResponse(header=self.store.header())
+        self.store.revision += 1
+        return self.store.delete(request)
+
+    async def DeleteRange(self, request, context):
+        await self.faults.inject(context)
+        return self._delete(request)
+
+    async def Txn(self, request, context):
+        await self.faults.inject(context)
+        return await _call(context, self.store.txn, request)
+
+    async def Compact(self, request, context):
+        await self.faults.inject(context)
+        await _call(context, self.store.compact, request.revision)
+        return CompactionResponse(header=self.store.header())
+
+
+class Watcher:
+
+    def __init__(self, watch_id: int, request: WatchCreateRequest, queue: asyncio.Queue) -> None:
+        self.watch_id = watch_id
+        self.request = request
+        self.queue = queue
+
+    def matches(self, event: Event) -> bool:
+        key, range_end, k = self.request.key, self.request.range_end, event.kv.key
+        if not range_end:
+            if k != key:
+                return False
+        elif k < key or (range_end != b"\0" and k >= range_end):
+            return False
+        filters = self.request.filters
+        if event.type == Event.PUT and WatchCreateRequest.NOPUT in filters:
+            return False
+        if event.type == Event.DELETE and WatchCreateRequest.NODELETE in filters:
+            return False
+        return True
+
+    def notify(self, event: Event) -> None:
+        if self.matches(event):
+            if not self.request.prev_kv and event.HasField("prev_kv"):
+                event = Event(type=event.type, kv=event.kv)
+            self.queue.put_nowait(WatchResponse(watch_id=self.watch_id, events=[event]))
+
+
+class WatchServicer(rpc_pb2_grpc.WatchServicer):
+
+    def __init__(self, store: Store, faults: Faults) -> None:
+        self.store = store
+        self.faults = faults
+        self.ids = itertools.count(1)
+
+    def _create(self, request: WatchCreateRequest, queue: asyncio.Queue) -> Optional[Watcher]:
+        watch_id = request.watch_id or next(self.ids)
+        start = request.start_revision
+        if start and start <= self.store.compacted:
+            queue.put_nowait(WatchResponse(watch_id=watch_id, created=True))
+            queue.put_nowait(WatchResponse(watch_id=watch_id, canceled=True,
+                                           compact_revision=self.store.compacted,
+                                           cancel_reason="mvcc: required revision has been compacted"))
+            return None
+        watcher = Watcher(watch_id, request, queue)
+        queue.put_nowait(WatchResponse(watch_id=watch_id, created=True))
+        if start:
+            for event in self.store.events:
+                if event.kv.mod_revision >= start:
+                    watcher.notify(event)
+        self.store.watchers.append(watcher)
+        return watcher
+
+    async def Watch(self, request_iterator, context):
+        await self.faults.inject(context)
+        queue: asyncio.Queue = asyncio.Queue()
+        watchers: Dict[int, Watcher] = {}
+
+        async def read_requests():
+            async for request in request_iterator:
+                if request.HasField("create_request"):
+                    watcher = self._create(request.create_request, queue)
+                    if watcher is not None:
+                        watchers[watcher.watch_id] = watcher
+                elif request.HasField("cancel_request"):
+                    watcher = watchers.pop(request.cancel_request.watch_id, None)
+                    if watcher is not None:
+                        self.store.watchers.remove(watcher)
+                        queue.put_nowait(WatchResponse(watch_id=watcher.watch_id, canceled=True))
+                elif request.HasField("progress_request"):
+                    queue.put_nowait(WatchResponse(watch_id=-1))
+            queue.put_nowait(None)
+
+        reader = asyncio.ensure_future(read_requests())
+        try:
+            while True:
+                response = await queue.get()
+                if response is None:
+                    break
+                response.header.CopyFrom(self.store.header())
+                yield response
+        finally:
+            reader.cancel()
+            for watcher in watchers.values():
+                self.store.watchers.remove(watcher)
+
+
+class LeaseServicer(rpc_pb2_grpc.LeaseServicer):
+
+    def __init__(self, store: Store, faults: Faults) -> None:
+        self.store = store
+        self.faults = faults
+
+    async def LeaseGrant(self, request, context):
+        await self.faults.inject(context)
+        lease_id = self.store.grant(request.TTL, request.ID)
+        return LeaseGrantResponse(header=self.store.header(), ID=lease_id, TTL=request.TTL)
+
+    async def LeaseRevoke(self, request, context):
+        await self.faults.inject(context)
+        if request.ID not in self.store.leases:
+            await context.abort(grpc.StatusCode.NOT_FOUND, "etcdserver: requested lease not found")
+        self.store.revoke(request.ID)
+        return LeaseRevokeResponse(header=self.store.header())
+
+    async def LeaseKeepAlive(self, request_iterator, context):
+        await self.faults.inject(context)
+        async for request in request_iterator:
+            lease = self.store.leases.get(request.ID)
+            if lease is None:
+                yield LeaseKeepAliveResponse(header=self.store.header(), ID=request.ID, TTL=-1)
+                continue
+            lease[1] = time.monotonic() + lease[0]
+            yield LeaseKeepAliveResponse(header=self.store.header(), ID=request.ID, TTL=lease[0])
+
+
+class ClusterServicer(rpc_pb2_grpc.ClusterServicer):
+
+    def __init__(self, store: Store, endpoint: str) -> None:
+        self.store = store
+        self.endpoint = endpoint
+
+    async def MemberList(self, request, context):
+        return MemberListResponse(header=self.store.header(), members=[Member(
+            ID=self.store.member_id, name="standin",
+            peerURLs=["http://localhost:2380"], clientURLs=["http://" + self.endpoint])])
+
+
+class MaintenanceServicer(rpc_pb2_grpc.MaintenanceServicer):
+
+    def __init__(self, store: Store, faults: Faults) -> None:
+        self.store = store
+        self.faults = faults
+
+    async def Status(self, request, context):
+        await self.faults.inject(context)
+        size = self.store.db_size()
+        return StatusResponse(header=self.store.header(), version="3.5.0-standin", dbSize=size,
+                              dbSizeInUse=size - self.store.garbage, leader=self.store.leader,
+                              raftIndex=self.store.revision, raftTerm=self.store.raft_term,
+                              raftAppliedIndex=self.store.revision)
+
+    async def Defragment(self, request, context):
+        await self.faults.inject(context)
+        self.store.garbage = 0
+        return DefragmentResponse(header=self.store.header())
+
+    async def HashKV(self, request, context):
+        await self.faults.inject(context)
+        await _call(context, self.store.check_revision, request.revision)
+        return HashKVResponse(header=self.store.header(), hash=self.store.hash(request.revision),
+                              compact_revision=self.store.compacted)
+
+
+async def serve(host: str = "localhost", port: int = 2379, faults: Optional[Faults] = None,
+                store: Optional[Store] = None) -> None:
+    store = store or Store()
+    faults = faults or Faults()
+    endpoint = "%s:%d" % (host, port)
+    server = grpc.aio.server()
+    rpc_pb2_grpc.add_KVServicer_to_server(KVServicer(store, faults), server)
+    rpc_pb2_grpc.add_WatchServicer_to_server(WatchServicer(store, faults), server)
+    rpc_pb2_grpc.add_LeaseServicer_to_server(LeaseServicer(store, faults), server)
+    rpc_pb2_grpc.add_ClusterServicer_to_server(ClusterServicer(store, endpoint), server)
+    rpc_pb2_grpc.add_MaintenanceServicer_to_server(MaintenanceServicer(store, faults), server)
+    server.add_insecure_port(endpoint)
+    await server.start()
+    logger.info("etcd stand-in listening on %s", endpoint)
+    elections = asyncio.ensure_future(faults.change_leaders(store))
+    try:
+        while True:
+            await asyncio.sleep(0.5)
+            store.expire()
+    finally:
+        elections.cancel()
+        await server.stop(None)
+
+
+@click.command(help="Runs an in-memory etcd stand-in with optional fault injection")
+@click.option("--host", default="localhost", show_default=True, help="Address to listen on", type=str)
+@click.option("--port", default=2379, show_default=True, help="Port to listen on", type=int)
+@click.option("--latency", default=0.0, help="Added latency per RPC in seconds", type=float)
+@click.option("--jitter", default=0.0, help="Uniform +/- jitter on the latency in seconds", type=float)
+@click.option("--error-rate", default=0.0, help="Fraction of RPCs that fail", type=float)
+@click.option("--error-code", default="UNAVAILABLE", show_default=True,
+              type=click.Choice(["UNAVAILABLE", "RESOURCE_EXHAUSTED", "DEADLINE_EXCEEDED", "INTERNAL"]),
+              help="Status code of injected failures")
+@click.option("--leader-change-interval", default=0.0, help="Seconds between simulated leader changes",
+              type=float)
+@click.option("--election-timeout", default=1.0, show_default=True,
+              help="Seconds RPCs fail with UNAVAILABLE after a leader change", type=float)
+def main(host, port, latency, jitter, error_rate, error_code, leader_change_interval, election_timeout):
+    logging.basicConfig(level=logging.INFO,
+                        format="%(levelname)s:%(name)s:%(lineno)s:%(message)s")
+    faults = Faults(latency=latency, jitter=jitter, error_rate=error_rate,
+                    error_code=grpc.StatusCode[error_code],
+                    leader_change_interval=leader_change_interval,
+                    election_timeout=election_timeout)
+    asyncio.run(serve(host, port, faults))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+import asyncio
+
+from app import Etcd
+from history import ADDED, CHANGED, REMOVED, diff_revisions
+from rpc_pb2 import DeleteRangeRequest, PutRequest
+from standin import Faults, KVServicer, Store
+
+
+class LocalStub:
+    """KV stub calling the stand-in servicer in process."""
+
+    def __init__(self) -> None:
+        self.servicer = KVServicer(Store(), Faults())
+
+    async def Range(self, request):
+        return await self.servicer.Range(request, None)
+
+    async def Put(self, request):
+        return await self.servicer.Put(request, None)
+
+    async def DeleteRange(self, request):
+        return await self.servicer.DeleteRange(request, None)
+
+
+async def _diff(page_size: int):
+    stub = LocalStub()
+    for i in range(10):
+        await stub.Put(PutRequest(key=b"/d/%02d" % i, value=b"v"))
+    from_rev = stub.servicer.store.revision
+    for i in range(0, 10, 2):
+        await stub.DeleteRange(DeleteRangeRequest(key=b"/d/%02d" % i))
+    await stub.Put(PutRequest(key=b"/d/03", value=b"w"))
+    await stub.Put(PutRequest(key=b"/d/10", value=b"v"))
+    etcd = Etcd(stub)
+    return [(kind, item.key) async for kind, item in
+            diff_revisions(etcd, b"/d/", b"/d0", from_rev, page_size=page_size)]
+
+
+def test_diff_pages_across_deletes():
+    expected = [(REMOVED, b"/d/00"), (REMOVED, b"/d/02"), (CHANGED, b"/d/03"), (REMOVED, b"/d/04"),
+                (REMOVED, b"/d/06"), (REMOVED, b"/d/08"), (ADDED, b"/d/10")]
+    assert asyncio.run(_diff(1000)) == expected
+    for page_size in (1, 2, 3):
+        assert asyncio.run(_diff(page_size)) == expected
@@ -0,0 +1,28 @@
+from typing import Union
+
+
+def to_bytes(key: Union[str, bytes]):
+    if key is None:
+        return key
+    if isinstance(key, bytes):
+        return key
+    return bytes(key, encoding="utf8")
+
+
+def to_string(key: Union[str, bytes]):
+    if key is None:
+        return key
+    if isinstance(key, str):
+        return key
+    return str(key, encoding="utf8")
+
+
+def prefix_range_end(prefix):
+    """
+    https://github.com/kragniz/python-etcd3/blob/master/etcd3/utils.py
+    """
+    stripped = bytes(prefix).rstrip(b"\xff")
+    if not stripped:
+        # nothing to increment, the range runs to the end of the keyspace
+        return b"\0" if prefix else b""
+    return stripped[:-1] + bytes((stripped[-1] + 1,))